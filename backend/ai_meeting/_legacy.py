@@ -1,29 +1,38 @@
 """旧 `backend.ai_meeting` モジュールを読み込むための補助。"""
 from __future__ import annotations
 
+import functools
 import importlib.util
+import sys
 from pathlib import Path
 from types import ModuleType
 from typing import Callable, Optional, TypeVar, cast
 
 TFunc = TypeVar("TFunc", bound=Callable[..., object])
 
+_LEGACY_MODULE_NAME = "backend.ai_meeting_legacy"
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_LEGACY_PATH = _PACKAGE_DIR.parent / f"{_PACKAGE_DIR.name}.py"
 
+
+@functools.lru_cache(maxsize=1)
 def load_legacy_module() -> ModuleType:
-    """旧 `backend/ai_meeting.py` をモジュールとして読み込む。"""
+    """旧 `backend/ai_meeting.py` をモジュールとして読み込む。
 
-    package_dir = Path(__file__).resolve().parent
-    legacy_path = package_dir.parent / f"{package_dir.name}.py"
+    読み込み結果はキャッシュし、2回目以降はコンパイル・実行を省略する。
+    """
 
-    spec = importlib.util.spec_from_file_location("backend.ai_meeting_legacy", legacy_path)
+    spec = importlib.util.spec_from_file_location(_LEGACY_MODULE_NAME, _LEGACY_PATH)
     if spec is None or spec.loader is None:
-        raise ImportError(f"旧モジュールを読み込めませんでした: {legacy_path}")
+        raise ImportError(f"旧モジュールを読み込めませんでした: {_LEGACY_PATH}")
 
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    sys.modules[_LEGACY_MODULE_NAME] = module
     return module
 
 
+@functools.lru_cache(maxsize=1)
 def get_main() -> Callable[..., object]:
     """旧モジュールの `main()` を取得する。"""
 
@@ -0,0 +1,48 @@
+"""発言本文の簡易トークン化・Jaccard 類似度・決定語判定（監視・KPI・評価で共有する）。"""
+from __future__ import annotations
+
+import functools
+import re
+from typing import AbstractSet, FrozenSet
+
+# 数字列と記号列を1パスで区切りとして扱う（数字は \w に含まれるため2段置換と結果は同じ）
+_RE_TOKEN_STRIP = re.compile(r"[0-9]+|[^\w\u3040-\u30ff\u4e00-\u9fff]+")
+# 決定密度の判定語（いずれかを含む発言を「決定あり」と数える）。
+# 会議ログで頻出する語を先に並べ、走査位置ごとの分岐を早く確定させる
+DECISION_WORDS = ("担当", "期限", "決定", "合意", "次回", "実施", "採用")
+_RE_DECISION = re.compile("|".join(map(re.escape, DECISION_WORDS)))
+
+
+def token_set(text: str) -> FrozenSet[str]:
+    """記号・数字を落とし、2文字以上の小文字トークン集合を返す。"""
+
+    # 空白で連結し直さずに区切り位置で直接分割する。小文字化は分割後に行う
+    # （先に小文字化すると "İ" のように \w でない結合文字を生む字で区切りが変わるため）
+    parts = (part.lower() for part in _RE_TOKEN_STRIP.split(text))
+    return frozenset(w for w in parts if len(w) > 1)
+
+
+@functools.lru_cache(maxsize=4096)
+def cached_token_set(text: str) -> FrozenSet[str]:
+    """`token_set` のキャッシュ版（同じ発言はウィンドウ移動のたびに再計算されるため）。"""
+
+    return token_set(text)
+
+
+def jaccard(a: AbstractSet[str], b: AbstractSet[str]) -> float:
+    """Jaccard 類似度（0〜1）。どちらかが空なら 0.0 を返す。"""
+
+    if not a or not b:
+        return 0.0
+    # 和集合は作らず |A|+|B|-|A∩B| で要素数だけ求める
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def has_decision_word(text: str) -> bool:
+    """決定語のいずれかを含むかを1回の走査で判定する。"""
+
+    return _RE_DECISION.search(text) is not None
+
+
+__all__ = ["DECISION_WORDS", "cached_token_set", "has_decision_word", "jaccard", "token_set"]
@@ -2,19 +2,24 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
+import signal
+import threading
 import warnings
 from typing import Dict, List, Optional, Sequence, Union
 
 from backend.defaults import DEFAULT_AGENT_NAMES
 
 from .config import AgentConfig, MeetingConfig
+from .logging import LiveLogWriter
 from .utils import clamp
 from .meeting import Meeting
 
 
-def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
-    """CLI 引数を解析して `argparse.Namespace` を返す。"""
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """CLI 引数パーサーを構築する。初回のみ生成し、以降は使い回す。"""
 
     ap = argparse.ArgumentParser(description="CLI AI Meeting (multi-agent)")
     ap.add_argument("--topic", required=True, help="会議テーマ（日本語OK）")
@@ -198,7 +203,19 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_false",
         help="従来の見出し・役職ラベルを表示（台本風UIに戻す）",
     )
-    return ap.parse_args(argv)
+    return ap
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """CLI 引数を解析して `argparse.Namespace` を返す。"""
+
+    args = _get_parser().parse_args(argv)
+    # パーサーは使い回すため、未指定時に既定値のリストがそのまま渡る。
+    # 呼び出し側の変更が次回の解析へ漏れないよう、リスト値は毎回複製して返す
+    for name, value in vars(args).items():
+        if isinstance(value, list):
+            setattr(args, name, list(value))
+    return args
 
 
 def build_agents(tokens: List[str]) -> List[AgentConfig]:
@@ -209,16 +226,26 @@ def build_agents(tokens: List[str]) -> List[AgentConfig]:
         "あなたは会議参加者です。日本語で短く発言し、直前の内容に具体的に応答し、"
         "次の一手を提示してください。見出し/箇条書き/長い前置きは禁止"
     )
+    # argv 由来の値は常に str なので、検証を省いた model_construct で十分
     for raw_token in tokens:
         raw = raw_token.strip()
         if "=" in raw:
             name, system = raw.split("=", 1)
-            agents.append(AgentConfig(name=name.strip(), system=system.strip()))
+            agents.append(AgentConfig.model_construct(name=name.strip(), system=system.strip()))
         else:
-            agents.append(AgentConfig(name=raw, system=default_system))
+            agents.append(AgentConfig.model_construct(name=raw, system=default_system))
     return agents
 
 
+def _parse_limit_value(text: str, token: str) -> int:
+    """ターン上限の数値部分を検証して 0 以上の整数へ変換する。"""
+
+    try:
+        return max(0, int(text))
+    except ValueError as exc:
+        raise ValueError(f"phase-turn-limit の値が数値ではありません: {token}") from exc
+
+
 def _parse_phase_turn_limit(tokens: List[str]) -> Optional[Union[int, Dict[str, int]]]:
     """フェーズ上限の指定文字列を解析する。"""
 
@@ -230,18 +257,11 @@ def _parse_phase_turn_limit(tokens: List[str]) -> Optional[Union[int, Dict[str,
         token = raw.strip()
         if not token:
             continue
-        if "=" in token:
-            key, value = token.split("=", 1)
-            key = key.strip()
-            try:
-                mapping[key] = max(0, int(value.strip()))
-            except ValueError as exc:  # noqa: PERF203 - わかりやすいエラーメッセージ優先
-                raise ValueError(f"phase-turn-limit の値が数値ではありません: {token}") from exc
+        key, sep, value = token.partition("=")
+        if sep:
+            mapping[key.strip()] = _parse_limit_value(value.strip(), token)
         else:
-            try:
-                scalar = max(0, int(token))
-            except ValueError as exc:  # noqa: PERF203
-                raise ValueError(f"phase-turn-limit の値が数値ではありません: {token}") from exc
+            scalar = _parse_limit_value(token, token)
     if mapping:
         if scalar is not None:
             mapping.setdefault("default", scalar)
@@ -260,8 +280,8 @@ def _parse_phase_goal(tokens: List[str]) -> Optional[Union[str, Dict[str, str]]]
         token = raw.strip()
         if not token:
             continue
-        if "=" in token:
-            key, value = token.split("=", 1)
+        key, sep, value = token.partition("=")
+        if sep:
             mapping[key.strip()] = value.strip()
         else:
             default_text = token
@@ -353,7 +373,7 @@ def build_meeting_config(args: argparse.Namespace) -> MeetingConfig:
         else max(0.0, float(args.semantic_core_weight_min))
     )
 
-    cfg = MeetingConfig(
+    return MeetingConfig(
         topic=args.topic,
         precision=clamp(args.precision, 1, 10),
         max_phases=args.max_phases,
@@ -407,15 +427,25 @@ def build_meeting_config(args: argparse.Namespace) -> MeetingConfig:
         summary_probe_phase_filename=getattr(
             args, "summary_probe_phase_filename", "summary_probe_phase.jsonl"
         ),
+        # KPI 関連も構築時にまとめて渡し、代入ごとの再検証を避ける
+        kpi_window=max(1, int(getattr(args, "kpi_window", 6))),
+        kpi_auto_prompt=getattr(args, "kpi_auto_prompt", True),
+        kpi_auto_tune=getattr(args, "kpi_auto_tune", True),
+        th_diversity_min=max(0.0, float(getattr(args, "th_diversity_min", 0.55))),
+        th_decision_min=max(0.0, float(getattr(args, "th_decision_min", 0.40))),
+        th_progress_stall=max(1, int(getattr(args, "th_progress_stall", 3))),
     )
-    cfg.kpi_window = max(1, int(getattr(args, "kpi_window", 6)))
-    cfg.kpi_auto_prompt = getattr(args, "kpi_auto_prompt", True)
-    cfg.kpi_auto_tune = getattr(args, "kpi_auto_tune", True)
-    cfg.th_diversity_min = max(0.0, float(getattr(args, "th_diversity_min", 0.55)))
-    cfg.th_decision_min = max(0.0, float(getattr(args, "th_decision_min", 0.40)))
-    cfg.th_progress_stall = max(1, int(getattr(args, "th_progress_stall", 3)))
 
-    return cfg
+
+def _close_and_exit(logger: LiveLogWriter, signum: int, frame: object) -> None:
+    """停止シグナル受信時にログを書き出して閉じ、実行中の LLM 通信を待たずに終了する。"""
+
+    try:
+        logger.close()
+    finally:
+        # SystemExit では並列生成のワーカースレッドの終了待ち（最大で通信タイムアウト）が入るため、
+        # 後始末を済ませたうえでプロセスを直ちに終える
+        os._exit(128 + signum)
 
 
 def main() -> None:
@@ -423,4 +453,12 @@ def main() -> None:
 
     args = parse_args()
     cfg = build_meeting_config(args)
-    Meeting(cfg).run()
+    meeting = Meeting(cfg)
+    # 停止 API は SIGTERM を送るため、既定動作（即時終了）の前にバッファ中のログを書き出す。
+    # signal.signal はメインスレッドでしか呼べないので、それ以外から起動された場合は設定しない
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, functools.partial(_close_and_exit, meeting.logger))
+    try:
+        meeting.run()
+    finally:
+        meeting.logger.close()
@@ -1,12 +1,12 @@
 """会議設定やエージェント設定に関するデータモデル。"""
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from .semantic_core import DEFAULT_CATEGORIES
 from .utils import clamp
 
 
@@ -17,23 +17,45 @@ DEFAULT_AGENT_IDENTITY: Dict[str, Any] = {
 }
 
 
+# 互換用途: 旧設定名 -> 現行フィールド名
+_COMPAT_RENAMES: Dict[str, str] = {"resolve_round": "resolve_phase"}
+
+
+def _copy_container(value: Any) -> Any:
+    """dict/list を再帰的に複製する（文字列・数値はそのまま共有する）。"""
+
+    if isinstance(value, dict):
+        return {key: _copy_container(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_container(item) for item in value]
+    return value
+
+
+def _fresh_identity() -> Dict[str, Any]:
+    """DEFAULT_AGENT_IDENTITY の独立したコピーを返す（JSON 相当の値だけなので deepcopy を使わない）。"""
+
+    return _copy_container(DEFAULT_AGENT_IDENTITY)
+
+
 class AgentConfig(BaseModel):
     """各会議参加エージェントの設定。"""
 
+    model_config = {"defer_build": True}
+
     name: str
     system: str
     style: str = ""  # 口調など任意
     reveal_think: bool = False  # trueだと“思考ログ”も表示（研修用）
     memory: List[str] = Field(default_factory=list, description="エージェント固有の覚書リスト")
     identity: Dict[str, Any] = Field(
-        default_factory=lambda: deepcopy(DEFAULT_AGENT_IDENTITY),
+        default_factory=_fresh_identity,
         description="エージェントの自己認識（Identity Kernel）。",
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
-    """会議内の1発言を表すデータ構造。"""
+    """会議内の1発言を表すデータ構造（大量に生成されるため __slots__ 化）。"""
 
     speaker: str
     content: str
@@ -65,8 +87,7 @@ class MeetingConfig(BaseModel):
     max_tokens: int = 800
     resolve_phase: bool = Field(
         True,
-        alias="resolve_round",
-        description="互換用途: resolve_round の旧設定名を許容",
+        description="最後に残課題消化フェーズを挿入するか（旧設定名 resolve_round も受け付ける）",
     )  # 最後に「残課題消化フェーズ」を自動挿入
     # --- 短文チャット（既定ON） ---
     chat_mode: bool = True
@@ -134,7 +155,7 @@ class MeetingConfig(BaseModel):
         description="セマンティックコアから共有メモをプロンプトへ注入するかどうか。",
     )
     semantic_core_prompt_categories: List[str] = Field(
-        default_factory=lambda: ["key_points", "open_issues"],
+        default_factory=lambda: list(DEFAULT_CATEGORIES),
         description="共有メモとして提示するカテゴリの優先順。",
     )
     semantic_core_prompt_per_category: int = Field(
@@ -168,14 +189,34 @@ class MeetingConfig(BaseModel):
 
     model_config = {
         "validate_assignment": True,
-        "populate_by_name": True,
+        # スキーマ構築は初回インスタンス化まで遅延し、--help 等の起動を軽くする。
+        # 構築済みバリデータはクラスに保持され以降の生成で再利用されるため、
+        # import 時に __pydantic_validator__ を先取りして遅延を打ち消さないこと。
+        "defer_build": True,
     }
 
+
+    @model_validator(mode="before")
+    @classmethod
+    def _apply_compat_renames(cls, data: Any) -> Any:
+        """旧設定名を現行フィールド名へ読み替える（alias 解決のコストを避けるため手動で行う）。"""
+
+        if isinstance(data, dict) and not _COMPAT_RENAMES.keys().isdisjoint(data):
+            data = dict(data)
+            for old_name, new_name in _COMPAT_RENAMES.items():
+                if old_name in data:
+                    value = data.pop(old_name)
+                    data.setdefault(new_name, value)
+        return data
+
     def model_post_init(self, __context: Any) -> None:  # noqa: D401 - BaseModel規約
         """Pydantic初期化後にフェーズ関連の未設定値を補完する。"""
 
-        # phase_turn_limit が未指定または0以下ならエージェント数から自動導出
-        if self.phase_turn_limit in (None, 0):
+        # 検証済みの値なので型は None / int / dict のいずれか。type() で1回だけ振り分ける
+        value = self.phase_turn_limit
+        value_type = type(value)
+        if value is None or (value_type is int and value == 0):
+            # 未指定または0ならエージェント数から自動導出
             agent_count = len(self.agents)
             if agent_count > 0:
                 # 既定では「各参加者が最低2回ずつ話せること」と
@@ -183,19 +224,27 @@ class MeetingConfig(BaseModel):
                 # いずれも満たすようにターン上限を自動導出する。
                 baseline = agent_count * 2
                 minimum = max(6, self.phase_window)
-                self.phase_turn_limit = max(baseline, minimum)
+                self.tune("phase_turn_limit", max(baseline, minimum))
             else:
-                self.phase_turn_limit = None
-        elif isinstance(self.phase_turn_limit, int) and self.phase_turn_limit < 0:
-            self.phase_turn_limit = None
-
-        # dict指定時も負数が混ざっていれば除去
-        if isinstance(self.phase_turn_limit, dict):
-            normalized: Dict[str, int] = {}
-            for key, value in self.phase_turn_limit.items():
-                if isinstance(value, int) and value > 0:
-                    normalized[key] = value
-            self.phase_turn_limit = normalized or None
+                self.tune("phase_turn_limit", None)
+        elif value_type is int:
+            if value < 0:
+                self.tune("phase_turn_limit", None)
+        elif value_type is dict:
+            # dict指定時も負数が混ざっていれば除去
+            normalized = {
+                key: limit for key, limit in value.items() if type(limit) is int and limit > 0
+            }
+            self.tune("phase_turn_limit", normalized or None)
+
+    def tune(self, name: str, value: Any) -> None:
+        """検証済みの値から導いた設定を、代入時検証を通さずに書き換える。
+
+        `validate_assignment` は外部からの代入を守るためのもので、内部の補完や
+        KPI 自動調整のように型・範囲が確定している値には不要なため迂回する。
+        """
+
+        object.__setattr__(self, name, value)
 
     def runtime_params(self) -> Dict[str, Union[float, int]]:
         """precision に応じた温度やクリティーク回数を算出する。"""
@@ -205,6 +254,20 @@ class MeetingConfig(BaseModel):
         critique_passes = clamp(int(round((p / 10) * 2)), 0, 2)  # 0~2回
         return {"temperature": temperature, "critique_passes": critique_passes}
 
+    @property
+    def agent_names(self) -> Tuple[str, ...]:
+        """エージェント名を設定順に並べたタプル。"""
+
+        return tuple(agent.name for agent in self.agents)
+
+    def find_agent(self, name: Optional[str]) -> Optional[AgentConfig]:
+        """名前からエージェント設定を引く（同名がいれば先頭）。見つからなければ None。"""
+
+        for agent in self.agents:
+            if agent.name == name:
+                return agent
+        return None
+
     def get_phase_turn_limit(self, kind: str = "discussion") -> Optional[int]:
         """フェーズ種別に応じてターン上限を決定する。"""
 
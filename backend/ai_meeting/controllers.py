@@ -4,15 +4,39 @@ from __future__ import annotations
 import random
 import re
 import typing
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional
 
+from ._textutil import cached_token_set, has_decision_word, jaccard
 from .config import MeetingConfig, Turn
 
-
-@dataclass
+# 残課題抽出で毎ターン使う正規表現（呼び出しごとの re キャッシュ参照を避ける）
+_RE_LABEL = re.compile(r"^[^:：]*[:：]\s*")
+# explore / exploit モードで強度に掛ける係数（パラメータ名, 係数）
+_EXPLORE_COEFFS = (
+    ("temperature", 0.30),
+    ("select_temp", 0.40),
+    ("sim_penalty", -0.20),
+    ("cooldown", -0.12),
+)
+_EXPLOIT_COEFFS = (
+    ("temperature", -0.28),
+    ("select_temp", -0.35),
+    ("sim_penalty", 0.18),
+    ("cooldown", 0.15),
+)
+# ランダム揺らぎの対象パラメータと、基準振れ幅に掛ける係数（辞書の並び順も兼ねる）
+_RANDOM_SPAN_SCALES = (
+    ("temperature", 1.0),
+    ("select_temp", 1.0),
+    ("sim_penalty", 0.6),
+    ("cooldown", 0.5),
+)
+
+
+@dataclass(slots=True)
 class PhaseEvent:
-    """フェーズ検知の状態遷移を表現するイベント。"""
+    """フェーズ検知の状態遷移を表現するイベント（observe ごとに更新されるため __slots__ 化）。"""
 
     phase_id: Optional[int]
     start_turn: int
@@ -27,10 +51,22 @@ class PhaseEvent:
     shock_used: Optional[str] = None
     kind: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """ログ用の辞書に変換する（全フィールドがスカラー値のため asdict の再帰コピーは行わない）。"""
+
+        return {name: getattr(self, name) for name in _PHASE_EVENT_FIELDS}
+
+
+# PhaseEvent のフィールド名（フェーズログのたびに fields() を引き直さないよう一度だけ求める）
+_PHASE_EVENT_FIELDS = tuple(f.name for f in fields(PhaseEvent))
+
 
 class Monitor:
     """フェーズ検知を担う監視クラス。"""
 
+    # 語彙ビット列の上限。超えたら語彙を作り直して整数幅の肥大を防ぐ
+    _VOCAB_LIMIT = 8192
+
     def __init__(self, cfg: MeetingConfig):
         self.cfg = cfg
         self._last_turn_idx = 0
@@ -38,6 +74,13 @@ class Monitor:
         self._current_event: Optional[PhaseEvent] = None
         self._candidate_hits = 0
         self._confirm_required = 2
+        # 直近ウィンドウ内の発言ペア類似度（(id(a), id(b)) -> (a, b, 類似度)）。
+        # 発言オブジェクト自体も保持し、id 再利用による取り違えを防ぐ。
+        self._pair_cache: Dict[typing.Tuple[int, int], typing.Tuple[Turn, Turn, float]] = {}
+        # トークン -> ビット位置。各発言のトークン集合を int のビット列で表す
+        self._vocab: Dict[str, int] = {}
+        # 直近ウィンドウの発言本文 -> (ビット列, 要素数)
+        self._bits_cache: Dict[str, typing.Tuple[int, int]] = {}
 
     def observe(
         self, history: List[Turn], unresolved_hist: List[int], window: int
@@ -49,18 +92,14 @@ class Monitor:
         if W < 3:
             return None
         recent = history[-W:]
-        sets = [self._token_set(t.content) for t in recent]
-        sim_sum = 0.0
-        cnt = 0
-        for i in range(W - 1):
-            for j in range(i + 1, W):
-                sim_sum += self._jacc(sets[i], sets[j])
-                cnt += 1
-        cohesion = (sim_sum / cnt) if cnt else 0.0
+        if len(self._vocab) > self._VOCAB_LIMIT:
+            self._vocab.clear()
+            self._bits_cache.clear()
+        bits = [self._token_bits(t.content) for t in recent]
+        self._bits_cache = {t.content: b for t, b in zip(recent, bits)}
         loop_hit = 0.0
         if len(recent) >= 2:
-            sA, sB = sets[-1], sets[-2]
-            loop_hit = self._jacc(sA, sB)
+            loop_hit = self._jacc_bits(bits[-1], bits[-2])
             self._loop_streak = self._loop_streak + 1 if loop_hit >= 0.90 else 0
         unresolved_drop = 0.0
         if len(unresolved_hist) >= 2:
@@ -68,6 +107,14 @@ class Monitor:
             last = unresolved_hist[-1]
             if first > 0:
                 unresolved_drop = max(0.0, (first - last) / first)
+        # ループ検知も未解決減少も満たさなければ、まとまり度はどの判定にも使われない
+        if (
+            self._loop_streak >= self.cfg.phase_loop_threshold
+            or unresolved_drop >= self.cfg.phase_unresolved_drop
+        ):
+            cohesion = self._window_cohesion(recent, bits)
+        else:
+            cohesion = 0.0
         reason = None
         if self._loop_streak >= self.cfg.phase_loop_threshold:
             reason = "loop"
@@ -88,7 +135,6 @@ class Monitor:
 
         start_turn = len(history) - W + 1
         end_turn = len(history)
-        summary = self._summarize_phase(recent)
         confidence = self._estimate_confidence(reason, cohesion, unresolved_drop)
 
         if not self._current_event:
@@ -99,7 +145,7 @@ class Monitor:
                 end_turn=end_turn,
                 status="candidate",
                 confidence=round(confidence, 3),
-                summary=summary,
+                summary=self._summarize_phase(recent),
                 reason=reason,
                 cohesion=round(cohesion, 3),
                 unresolved_drop=round(unresolved_drop, 3),
@@ -110,7 +156,7 @@ class Monitor:
         # すでに候補/確定済みのイベントが進行中
         self._current_event.start_turn = min(self._current_event.start_turn, start_turn)
         self._current_event.end_turn = end_turn
-        self._current_event.summary = summary
+        self._current_event.summary = self._summarize_phase(recent)
         self._current_event.reason = reason
         self._current_event.cohesion = round(cohesion, 3)
         self._current_event.unresolved_drop = round(unresolved_drop, 3)
@@ -127,6 +173,36 @@ class Monitor:
         # confirmed 状態のまま継続中
         return None
 
+    def _window_cohesion(
+        self, recent: List[Turn], bits: List[typing.Tuple[int, int]]
+    ) -> float:
+        """ウィンドウ内の全発言ペアの平均類似度（まとまり度）を求める。
+
+        ウィンドウが1発言ずれるだけなら大半のペアは前回計算済みなので再利用する
+        （加算順は全ペア計算と同じに保ち、結果を変えない）。
+        """
+
+        W = len(recent)
+        ids = [id(t) for t in recent]
+        prev_pairs = self._pair_cache
+        pairs: Dict[typing.Tuple[int, int], typing.Tuple[Turn, Turn, float]] = {}
+        sim_sum = 0.0
+        cnt = 0
+        for i in range(W - 1):
+            turn_i = recent[i]
+            for j in range(i + 1, W):
+                key = (ids[i], ids[j])
+                cached = prev_pairs.get(key)
+                if cached is not None and cached[0] is turn_i and cached[1] is recent[j]:
+                    sim = cached[2]
+                else:
+                    sim = self._jacc_bits(bits[i], bits[j])
+                pairs[key] = (turn_i, recent[j], sim)
+                sim_sum += sim
+                cnt += 1
+        self._pair_cache = pairs
+        return (sim_sum / cnt) if cnt else 0.0
+
     def _estimate_confidence(
         self, reason: Optional[str], cohesion: float, unresolved_drop: float
     ) -> float:
@@ -144,25 +220,44 @@ class Monitor:
         return max(0.0, min(1.0, base))
 
     def _summarize_phase(self, turns: List[Turn]) -> str:
-        texts = [t.content for t in turns]
-        head = texts[0][:60]
-        tail = texts[-1][:60]
+        # 先頭と末尾しか使わないので、ウィンドウ全体の本文リストは作らない
+        head = turns[0].content[:60]
+        tail = turns[-1].content[:60]
         return f"フェーズ要約: 先頭『{head}…』→末尾『{tail}…』"
 
     @staticmethod
-    def _token_set(text: str) -> set:
-        t = re.sub(r"[0-9]+", " ", text)
-        t = re.sub(r"[^\w\u3040-\u30ff\u4e00-\u9fff]+", " ", t, flags=re.UNICODE)
-        toks = [w for w in t.lower().split() if len(w) > 1]
-        return set(toks)
+    def _token_set(text: str) -> frozenset:
+        return cached_token_set(text)
+
+    def _token_bits(self, text: str) -> typing.Tuple[int, int]:
+        """発言のトークン集合を語彙上のビット列と要素数に変換する。"""
+
+        cached = self._bits_cache.get(text)
+        if cached is not None:
+            return cached
+        vocab = self._vocab
+        mask = 0
+        for token in self._token_set(text):
+            bit = vocab.get(token)
+            if bit is None:
+                bit = vocab[token] = len(vocab)
+            mask |= 1 << bit
+        return mask, mask.bit_count()
 
     @staticmethod
-    def _jacc(a: set, b: set) -> float:
-        if not a or not b:
+    def _jacc(a: typing.AbstractSet[str], b: typing.AbstractSet[str]) -> float:
+        return jaccard(a, b)
+
+    @staticmethod
+    def _jacc_bits(a: typing.Tuple[int, int], b: typing.Tuple[int, int]) -> float:
+        """`_jacc` のビット列版。積集合の要素数を popcount で求める。"""
+
+        mask_a, count_a = a
+        mask_b, count_b = b
+        if not count_a or not count_b:
             return 0.0
-        inter = len(a & b)
-        union = len(a | b)
-        return inter / union
+        inter = (mask_a & mask_b).bit_count()
+        return inter / (count_a + count_b - inter)
 
 
 class KPIFeedback:
@@ -177,23 +272,27 @@ class KPIFeedback:
         window = turns[-W:] if len(turns) >= W else turns[:]
         if len(window) < 3:
             return {}
-        texts = [t.content for t in window]
-        sims = []
-        for i in range(len(texts) - 1):
-            a = self._token_set(texts[i])
-            b = self._token_set(texts[i + 1])
-            sims.append(self._jacc(a, b))
+        # 隣接類似度と決定語ヒットを1回の走査でまとめて集計する
+        sims: List[float] = []
+        hits = 0
+        prev_set = None
+        for turn in window:
+            text = turn.content
+            cur_set = self._token_set(text)
+            if prev_set is not None:
+                sims.append(self._jacc(prev_set, cur_set))
+            if has_decision_word(text):
+                hits += 1
+            prev_set = cur_set
+        # 合計は sum() に任せ、従来と同じ加算結果を保つ
         diversity = 1 - (sum(sims) / len(sims) if sims else 0.0)
-        decision_words = ("決定", "合意", "採用", "実施", "次回", "担当", "期限")
-        hits = sum(1 for t in texts if any(w in t for w in decision_words))
-        decision_density = hits / max(1, len(texts))
+        decision_density = hits / max(1, len(window))
         stall = False
         if len(unresolved_hist) >= min(4, W):
             recent = unresolved_hist[-min(4, W):]
-            non_increasing = all(recent[i] <= recent[i - 1] for i in range(1, len(recent)))
-            strictly_decreased = any(recent[i] < recent[i - 1] for i in range(1, len(recent)))
-            no_change = len(set(recent)) == 1
-            stall = no_change or (non_increasing and not strictly_decreased)
+            # 「増加なし かつ 減少なし」は全要素が等しいことと同値なので、
+            # 停滞判定は横ばいかどうかだけを見ればよい
+            stall = recent.count(recent[0]) == len(recent)
 
         actions: Dict[str, typing.Any] = {
             "metrics": {
@@ -237,16 +336,12 @@ class KPIFeedback:
         self._last_hint = None
 
     @staticmethod
-    def _token_set(text: str) -> set:
-        t = re.sub(r"[0-9]+", " ", text)
-        t = re.sub(r"[^\w\u3040-\u30ff\u4e00-\u9fff]+", " ", t)
-        return {w for w in t.lower().split() if len(w) > 1}
+    def _token_set(text: str) -> frozenset:
+        return cached_token_set(text)
 
     @staticmethod
-    def _jacc(a: set, b: set) -> float:
-        if not a or not b:
-            return 0.0
-        return len(a & b) / len(a | b)
+    def _jacc(a: typing.AbstractSet[str], b: typing.AbstractSet[str]) -> float:
+        return jaccard(a, b)
 
 
 class ShockEngine:
@@ -256,6 +351,12 @@ class ShockEngine:
         self.cfg = cfg
         self.mode = cfg.shock
         self._rng = random.Random()
+        # モード名 -> 算出メソッド（未知のモードは random 扱い）
+        self._modes = {
+            "explore": self._mode_explore,
+            "exploit": self._mode_exploit,
+            "random": self._mode_random,
+        }
 
     def generate(self, ctx: Dict[str, typing.Any]) -> Dict[str, float]:
         """現在モードに応じた揺らぎ量を返す。
@@ -264,13 +365,8 @@ class ShockEngine:
         戻り値は `{"temperature": +0.15}` のような「ベースラインに足し込む差分」。
         """
 
-        metrics = ctx.get("metrics") or {}
         mode = ctx.get("mode") or self.mode or "random"
-        if mode == "explore":
-            return self._mode_explore(metrics, ctx)
-        if mode == "exploit":
-            return self._mode_exploit(metrics, ctx)
-        return self._mode_random(metrics, ctx)
+        return self._modes.get(mode, self._mode_random)(ctx.get("metrics") or {}, ctx)
 
     # --- 個別モード ---
     def _mode_explore(
@@ -286,12 +382,7 @@ class ShockEngine:
         )
         if metrics.get("stall"):
             severity = max(severity, 0.6)
-        adjustments = {
-            "temperature": round(0.30 * severity, 3),
-            "select_temp": round(0.40 * severity, 3),
-            "sim_penalty": round(-0.20 * severity, 3),
-            "cooldown": round(-0.12 * severity, 3),
-        }
+        adjustments = {key: round(coeff * severity, 3) for key, coeff in _EXPLORE_COEFFS}
         return self._remove_near_zero(adjustments)
 
     def _mode_exploit(
@@ -307,12 +398,7 @@ class ShockEngine:
         )
         if metrics.get("stall"):
             severity = max(severity, 0.5)
-        adjustments = {
-            "temperature": round(-0.28 * severity, 3),
-            "select_temp": round(-0.35 * severity, 3),
-            "sim_penalty": round(0.18 * severity, 3),
-            "cooldown": round(0.15 * severity, 3),
-        }
+        adjustments = {key: round(coeff * severity, 3) for key, coeff in _EXPLOIT_COEFFS}
         return self._remove_near_zero(adjustments)
 
     def _mode_random(
@@ -321,15 +407,12 @@ class ShockEngine:
         """軽微なランダム揺らぎを返す。"""
 
         span = ctx.get("random_span", 0.15)
-        def _rand(delta: float) -> float:
-            return round(self._rng.uniform(-delta, delta), 3)
-
-        adjustments = {
-            "temperature": _rand(span),
-            "select_temp": _rand(span),
-            "sim_penalty": _rand(span * 0.6),
-            "cooldown": _rand(span * 0.5),
-        }
+        # Random.uniform(-d, d) と同じ式 (-d + 2d*random()) を、束縛済みの random() で直接評価する
+        draw = self._rng.random
+        adjustments = {}
+        for key, scale in _RANDOM_SPAN_SCALES:
+            delta = span * scale
+            adjustments[key] = round(-delta + (delta + delta) * draw(), 3)
         return self._remove_near_zero(adjustments)
 
     # --- 補助関数 ---
@@ -370,17 +453,22 @@ class PendingTracker:
     """残課題やリスクを抽出して管理するトラッカー。"""
 
     KEYS = ("残課題", "課題", "リスク", "改善", "是正", "対策")
+    # KEYS のいずれかを含むかを1回の走査で判定する
+    _KEY_PATTERN = re.compile("|".join(map(re.escape, KEYS)))
 
     def __init__(self):
         self.items = set()
 
     def add_from_text(self, text: str):
+        # キーワードを1つも含まない発言は行分割せずに終える
+        if not self._KEY_PATTERN.search(text):
+            return
         for line in text.splitlines():
             s = line.strip(" ・-*\t")
             if not s:
                 continue
-            if any(k in s for k in self.KEYS):
-                s = re.sub(r"^[^:：]*[:：]\s*", "", s)
+            if self._KEY_PATTERN.search(s):
+                s = _RE_LABEL.sub("", s)
                 self.items.add(s)
 
     def clear(self):
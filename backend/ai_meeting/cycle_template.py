@@ -1,9 +1,14 @@
 """サイクル出力テンプレートの生成と解析ユーティリティ。"""
 from __future__ import annotations
 
+import functools
 import json
+import re
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+# json.dumps(..., ensure_ascii=False) と同じ出力を、呼び出しごとにエンコーダを作らずに得る
+_json_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
 # 会議ルールで禁止されている語句。必要に応じてここで拡張する。
 _FORBIDDEN_TERMS: Tuple[str, ...] = (
     "見出し",
@@ -17,122 +22,98 @@ _FORBIDDEN_TERMS: Tuple[str, ...] = (
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _forbidden_pattern(forbidden_terms: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """禁止語のいずれかに一致する正規表現を返す（語句の組ごとに1度だけコンパイルする）。"""
+
+    terms = [term for term in forbidden_terms if term]
+    if not terms:
+        return None
+    return re.compile("|".join(map(re.escape, terms)))
+
+
 def _sanitize_text(text: Optional[str], forbidden_terms: Sequence[str]) -> str:
     """禁止語を除去し、周囲の空白を整えて返す。"""
 
     if text is None:
         return ""
     value = str(text)
+    pattern = _forbidden_pattern(tuple(forbidden_terms))
+    # 禁止語を1つも含まない文字列（大半のケース）は1回の走査で確定させる
+    if pattern is None or not pattern.search(value):
+        return value.strip()
+    # 除去によって別の禁止語が新たに現れる場合も従来どおり扱うため、語句順に置換する
     for term in forbidden_terms:
         if term:
             value = value.replace(term, "")
     return value.strip()
 
 
-def _build_diverge_entries(
-    base_text: str, candidate: Any, terms: Tuple[str, ...]
-) -> List[Dict[str, Any]]:
-    """Diverge ブロックを正規化して返す。"""
+# 各ブロックのエントリ構成（フィールド名, 値が文字列リストか）。先頭フィールドが本文に当たる
+_BLOCK_SCHEMAS: Dict[str, Tuple[Tuple[str, bool], ...]] = {
+    "diverge": (("hypothesis", False), ("assumptions", True)),
+    "learn": (("insight", False), ("why", False), ("links", True)),
+    "converge": (("commit", False), ("reason", False)),
+}
 
-    entries: List[Dict[str, Any]] = []
-    if isinstance(candidate, list):
-        for item in candidate:
-            if isinstance(item, dict):
-                hypothesis = _sanitize_text(item.get("hypothesis"), terms)
-                assumptions_raw = item.get("assumptions")
-                assumptions: List[str] = []
-                if isinstance(assumptions_raw, (list, tuple)):
-                    assumptions = [
-                        _sanitize_text(val, terms)
-                        for val in assumptions_raw
-                        if _sanitize_text(val, terms)
-                    ]
-                if hypothesis or assumptions:
-                    entries.append({
-                        "hypothesis": hypothesis,
-                        "assumptions": assumptions,
-                    })
-            elif isinstance(item, str):
-                hypothesis = _sanitize_text(item, terms)
-                if hypothesis:
-                    entries.append({"hypothesis": hypothesis, "assumptions": []})
 
-    if not entries:
-        hypothesis = _sanitize_text(base_text, terms)
-        if hypothesis:
-            entries.append({"hypothesis": hypothesis, "assumptions": []})
+def _sanitize_list(values: Any, terms: Tuple[str, ...]) -> List[str]:
+    """文字列リストの各要素を整え、空になった要素を除いて返す。"""
 
-    return entries
+    if not isinstance(values, (list, tuple)):
+        return []
+    cleaned = (_sanitize_text(val, terms) for val in values)
+    return [val for val in cleaned if val]
 
 
-def _build_learn_entries(
-    base_text: str, candidate: Any, terms: Tuple[str, ...]
+def _build_entries(
+    kind: str, base_text: str, candidate: Any, terms: Tuple[str, ...]
 ) -> List[Dict[str, Any]]:
-    """Learn ブロックを正規化して返す。"""
+    """Diverge / Learn / Converge ブロックを正規化して返す。
 
-    entries: List[Dict[str, Any]] = []
-    if isinstance(candidate, list):
-        for item in candidate:
-            if isinstance(item, dict):
-                insight = _sanitize_text(item.get("insight"), terms)
-                why = _sanitize_text(item.get("why"), terms)
-                links_raw = item.get("links")
-                links: List[str] = []
-                if isinstance(links_raw, (list, tuple)):
-                    links = [
-                        _sanitize_text(val, terms)
-                        for val in links_raw
-                        if _sanitize_text(val, terms)
-                    ]
-                if insight or why or links:
-                    entries.append({
-                        "insight": insight,
-                        "why": why,
-                        "links": links,
-                    })
-            elif isinstance(item, str):
-                insight = _sanitize_text(item, terms)
-                if insight:
-                    entries.append({"insight": insight, "why": "", "links": []})
-
-    if not entries:
-        clean = _sanitize_text(base_text, terms)
-        if clean:
-            lines = [
-                line.strip("-・* \t")
-                for line in clean.splitlines()
-                if line.strip("-・* \t")
-            ]
-            if not lines:
-                lines = [clean]
-            for line in lines:
-                entries.append({"insight": line, "why": "", "links": []})
+    エージェント出力の候補が使えない場合は、整形済みの ``base_text`` から組み立てる
+    （Learn のみ行ごとに分けて複数エントリにする）。
+    """
 
-    return entries
+    schema = _BLOCK_SCHEMAS[kind]
 
-
-def _build_converge_entries(
-    base_text: str, candidate: Any, terms: Tuple[str, ...]
-) -> List[Dict[str, Any]]:
-    """Converge ブロックを正規化して返す。"""
+    def _entry(text: str) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {}
+        for index, (name, is_list) in enumerate(schema):
+            entry[name] = [] if is_list else (text if index == 0 else "")
+        return entry
 
     entries: List[Dict[str, Any]] = []
     if isinstance(candidate, list):
         for item in candidate:
             if isinstance(item, dict):
-                commit = _sanitize_text(item.get("commit"), terms)
-                reason = _sanitize_text(item.get("reason"), terms)
-                if commit or reason:
-                    entries.append({"commit": commit, "reason": reason})
+                entry = {
+                    name: (
+                        _sanitize_list(item.get(name), terms)
+                        if is_list
+                        else _sanitize_text(item.get(name), terms)
+                    )
+                    for name, is_list in schema
+                }
+                if any(entry.values()):
+                    entries.append(entry)
             elif isinstance(item, str):
-                commit = _sanitize_text(item, terms)
-                if commit:
-                    entries.append({"commit": commit, "reason": ""})
+                text = _sanitize_text(item, terms)
+                if text:
+                    entries.append(_entry(text))
 
     if not entries:
-        commit = _sanitize_text(base_text, terms)
-        if commit:
-            entries.append({"commit": commit, "reason": ""})
+        clean = _sanitize_text(base_text, terms)
+        if clean:
+            if kind == "learn":
+                lines = [
+                    line.strip("-・* \t")
+                    for line in clean.splitlines()
+                    if line.strip("-・* \t")
+                ]
+                entries.extend(_entry(line) for line in lines or [clean])
+            else:
+                entries.append(_entry(clean))
 
     return entries
 
@@ -160,20 +141,10 @@ def build_cycle_payload(
         if isinstance(parsed, dict):
             agent_payload = parsed
 
-    diverge_entries = _build_diverge_entries(
-        diverge_text,
-        agent_payload.get("diverge"),
-        terms,
-    )
-    learn_entries = _build_learn_entries(
-        learn_text,
-        agent_payload.get("learn"),
-        terms,
-    )
-    converge_entries = _build_converge_entries(
-        converge_text,
-        agent_payload.get("converge"),
-        terms,
+    diverge_entries = _build_entries("diverge", diverge_text, agent_payload.get("diverge"), terms)
+    learn_entries = _build_entries("learn", learn_text, agent_payload.get("learn"), terms)
+    converge_entries = _build_entries(
+        "converge", converge_text, agent_payload.get("converge"), terms
     )
 
     next_goal_text = goal_text
@@ -187,7 +158,7 @@ def build_cycle_payload(
         "converge": converge_entries,
         "next_goal": next_goal_text,
     }
-    return json.dumps(payload, ensure_ascii=False)
+    return _json_dumps(payload)
 
 
 def parse_cycle_content(content: Any) -> Optional[Dict[str, Any]]:
@@ -211,28 +182,36 @@ def extract_cycle_text(content: Any, field: str = "converge") -> str:
     """サイクル JSON から指定フィールドの文字列を抽出する。"""
 
     if isinstance(content, str):
-        data = parse_cycle_content(content)
-        if data is not None:
-            value = data.get(field)
-            if isinstance(value, str):
-                return value.strip()
-            if isinstance(value, list):
-                parts: List[str] = []
-                for item in value:
-                    if isinstance(item, dict):
-                        for key in ("commit", "hypothesis", "insight", "reason", "why"):
-                            text = item.get(key)
-                            if isinstance(text, str) and text.strip():
-                                parts.append(text.strip())
-                                break
-                    elif isinstance(item, str) and item.strip():
-                        parts.append(item.strip())
-                if parts:
-                    return " / ".join(parts)
-        return content.strip()
+        # 同じ発言本文は表示・要約・プロンプト構築で繰り返し参照されるため、解析結果を再利用する
+        return _extract_cycle_text(content, field)
     return ""
 
 
+@functools.lru_cache(maxsize=1024)
+def _extract_cycle_text(content: str, field: str) -> str:
+    """`extract_cycle_text` の本体（文字列入力のみ）。"""
+
+    data = parse_cycle_content(content)
+    if data is not None:
+        value = data.get(field)
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, list):
+            parts: List[str] = []
+            for item in value:
+                if isinstance(item, dict):
+                    for key in ("commit", "hypothesis", "insight", "reason", "why"):
+                        text = item.get(key)
+                        if isinstance(text, str) and text.strip():
+                            parts.append(text.strip())
+                            break
+                elif isinstance(item, str) and item.strip():
+                    parts.append(item.strip())
+            if parts:
+                return " / ".join(parts)
+    return content.strip()
+
+
 __all__ = [
     "build_cycle_payload",
     "parse_cycle_content",
@@ -1,11 +1,14 @@
 """会議の KPI を算出する評価関連ロジック。"""
 from __future__ import annotations
 
-import re
 from typing import Dict, List
 
+from ._textutil import cached_token_set, has_decision_word, jaccard
 from .config import MeetingConfig, Turn
 
+# 最終成果物に含まれているべき仕様キーワード（網羅率の分母）
+_SPEC_KEYWORDS = ("空間", "用具", "動作", "得点", "安全", "手順", "KPI")
+
 
 class KPIEvaluator:
     """会議ログから KPI を算出するユーティリティ。"""
@@ -16,8 +19,7 @@ class KPIEvaluator:
     def evaluate(self, history: List[Turn], pending, final_text: str) -> Dict:
         """会議の進捗状況を表す各種 KPI を計算する。"""
 
-        turns = [h.content for h in history]
-        n_turns = len(turns)
+        n_turns = len(history)
         if pending is not None and hasattr(pending, "items"):
             init_unres = getattr(pending, "initial", None)
             if init_unres is None:
@@ -28,17 +30,22 @@ class KPIEvaluator:
             init_unres = 0
             final_unres = 0
         progress = (init_unres - final_unres) / max(1, init_unres)
-        sims = []
-        for i in range(n_turns - 1):
-            a = self._token_set(turns[i])
-            b = self._token_set(turns[i + 1])
-            sims.append(self._jacc(a, b))
+        # 隣接類似度と決定語ヒットを1回の走査で集計する。
+        # トークン集合は会議中に監視・KPI 制御が作ったキャッシュをそのまま使う
+        sims: List[float] = []
+        hits = 0
+        prev_set = None
+        for turn in history:
+            text = turn.content
+            cur_set = self._token_set(text)
+            if prev_set is not None:
+                sims.append(self._jacc(prev_set, cur_set))
+            if has_decision_word(text):
+                hits += 1
+            prev_set = cur_set
         diversity = 1 - (sum(sims) / len(sims) if sims else 0)
-        decision_words = ["決定", "合意", "採用", "実施", "次回", "担当", "期限"]
-        hits = sum(1 for t in turns if any(w in t for w in decision_words))
         decision_density = hits / n_turns if n_turns else 0
-        must = ["空間", "用具", "動作", "得点", "安全", "手順", "KPI"]
-        coverage = sum(1 for m in must if m in final_text) / len(must)
+        coverage = sum(1 for m in _SPEC_KEYWORDS if m in final_text) / len(_SPEC_KEYWORDS)
         return {
             "progress": round(progress, 3),
             "diversity": round(diversity, 3),
@@ -47,17 +54,12 @@ class KPIEvaluator:
         }
 
     @staticmethod
-    def _token_set(text: str) -> set:
-        t = re.sub(r"[0-9]+", " ", text)
-        t = re.sub(r"[^\w\u3040-\u30ff\u4e00-\u9fff]+", " ", t, flags=re.UNICODE)
-        toks = [w for w in t.lower().split() if len(w) > 1]
-        return set(toks)
+    def _token_set(text: str) -> frozenset:
+        return cached_token_set(text)
 
     @staticmethod
-    def _jacc(a: set, b: set) -> float:
-        if not a or not b:
-            return 0.0
-        return len(a & b) / len(a | b)
+    def _jacc(a: frozenset, b: frozenset) -> float:
+        return jaccard(a, b)
 
 
 __all__ = ["KPIEvaluator"]
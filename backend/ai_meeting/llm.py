@@ -1,9 +1,14 @@
 """LLM バックエンドの実装。"""
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import threading
 import typing
-from typing import Any, Iterable, Optional
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Iterable, List, Optional, Sequence
 from urllib.parse import urlparse
 import ipaddress
 
@@ -20,16 +25,114 @@ class LLMRequest(BaseModel):
     metadata: dict[str, Any] | None = None
 
 
+def is_cache_enabled() -> bool:
+    """環境変数 `AI_MEETING_CACHE` から応答キャッシュの有効/無効を判定する。"""
+
+    return os.getenv("AI_MEETING_CACHE", "").lower() in {"1", "true", "on"}
+
+
+class _ResponseCache:
+    """同一リクエストへの応答を保持する小さな LRU キャッシュ。"""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = max(1, int(capacity))
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, req: LLMRequest) -> str:
+        """モデル名・温度・最大トークン数・プロンプト全体からキャッシュキーを生成する。"""
+
+        raw = json.dumps(
+            [model, req.temperature, req.max_tokens, req.system, req.messages],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """キャッシュ済みの応答を返す。未登録なら None。"""
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """応答を登録し、容量超過分を古い順に破棄する。"""
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class LLMBackend:
     """LLM バックエンドのインターフェース。"""
 
+    # 同時に発行してよいリクエスト数。1 なら呼び出し側は逐次実行する。
+    max_concurrency: int = 1
+    model: str = ""
+    # 応答キャッシュ（AI_MEETING_CACHE=1 のときだけ各実装の __init__ で用意する）
+    _cache: Optional[_ResponseCache] = None
+
     def generate(self, req: LLMRequest) -> str:
+        """応答を生成する。キャッシュが有効なら同一リクエストの応答を再利用する。"""
+
+        cache = self._cache
+        if cache is None:
+            return self._generate(req)
+        key = cache.make_key(self.model, req)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        text = self._generate(req)
+        cache.put(key, text)
+        return text
+
+    def _generate(self, req: LLMRequest) -> str:
+        """実際に LLM を呼び出して応答を返す（各バックエンドで実装する）。"""
+
         raise NotImplementedError
 
+    def generate_many(self, reqs: Sequence[LLMRequest]) -> List[str]:
+        """複数リクエストを処理し、入力順で応答を返す。
+
+        `max_concurrency` が 2 以上ならスレッドプールで同時に送信し、
+        通信待ちを重ねる（応答時間の合計ではなく最大値に近づく）。
+        """
+
+        workers = min(len(reqs), self.max_concurrency)
+        if workers <= 1:
+            return [self.generate(req) for req in reqs]
+        ex = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [ex.submit(self.generate, req) for req in reqs]
+            # 入力順に待つと先頭の遅い通信が後続の失敗を隠すため、最初の例外で待機を打ち切る
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                if future.done() and future.exception() is not None:
+                    raise future.exception()
+            results = [future.result() for future in futures]
+        except BaseException:
+            # 失敗・停止時は実行中の通信の完了を待たず、未着手の分も取り消して即座に抜ける
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+        ex.shutdown()
+        return results
+
 
 class OpenAIBackend(LLMBackend):
     """OpenAI API を利用するバックエンド。"""
 
+    # クライアントはスレッド間で共有できるため、レート制限に配慮した範囲で同時送信する
+    max_concurrency = 4
+
     def __init__(self, model: Optional[str] = None):
         try:
             from openai import OpenAI
@@ -40,8 +143,9 @@ class OpenAIBackend(LLMBackend):
                 "OpenAI backend requires 'openai' package. Please `pip install openai` or use `--backend ollama`."
             ) from e
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self._cache = _ResponseCache() if is_cache_enabled() else None
 
-    def generate(self, req: LLMRequest) -> str:
+    def _generate(self, req: LLMRequest) -> str:
         """Chat Completions API を利用して応答を生成する。"""
 
         messages: list[dict[str, str]] = [{"role": "system", "content": req.system}] + req.messages
@@ -58,10 +162,20 @@ class OpenAIBackend(LLMBackend):
 class OllamaBackend(LLMBackend):
     """ローカルの Ollama API を利用するバックエンド。"""
 
+    # Ollama 側の並列処理（OLLAMA_NUM_PARALLEL）に合わせて同時 POST を許可する
+    max_concurrency = 8
+
     def __init__(self, model: str = "gpt-oss:20b", host: str = "http://127.0.0.1:11434"):
         import requests
-
-        self.requests = requests
+        from requests.adapters import HTTPAdapter
+
+        # 発言ごとに TCP 接続を張り直さないよう、keep-alive のセッションを使い回す。
+        # generate_many の同時送信数ぶんは接続プールに保持する
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self.requests = session
         self.model = model
         parsed = urlparse(host)
         if parsed.scheme not in {"http", "https"}:
@@ -78,6 +192,13 @@ class OllamaBackend(LLMBackend):
             port = 443 if parsed.scheme == "https" else 80
 
         self.host = f"{parsed.scheme}://{hostname}:{port}"
+        self._chat_url = f"{self.host}/api/chat"
+        self._json_headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Accept": "application/json",
+        }
+        # AI_MEETING_CACHE=1 のときだけ同一プロンプトの応答を再利用する
+        self._cache = _ResponseCache() if is_cache_enabled() else None
 
     @staticmethod
     def _is_local_hostname(hostname: str) -> bool:
@@ -91,17 +212,18 @@ class OllamaBackend(LLMBackend):
             return False
         return ip.is_loopback or ip.is_private
 
-    def generate(self, req: LLMRequest) -> str:
+    def _generate(self, req: LLMRequest) -> str:
         """Ollama のチャット API を利用して応答を生成する。"""
 
-        url = f"{self.host}/api/chat"
         payload = {
             "model": self.model,
             "messages": [{"role": "system", "content": req.system}] + req.messages,
             "options": {"temperature": req.temperature},
             "stream": False,
         }
-        r = self.requests.post(url, json=payload, timeout=600)
+        # requests 側の json= 直列化を通さず、UTF-8 のまま一度だけエンコードする
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        r = self.requests.post(self._chat_url, data=body, headers=self._json_headers, timeout=600)
         r.raise_for_status()
         data = r.json()
         return data.get("message", {}).get("content", "").strip()
@@ -112,4 +234,5 @@ __all__ = [
     "LLMRequest",
     "OllamaBackend",
     "OpenAIBackend",
+    "is_cache_enabled",
 ]
@@ -2,11 +2,56 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import threading
+import time
+import weakref
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+# ログディレクトリ名に使えない文字（英数字・「_」と「-（）()[]」以外）。1回の置換で「_」に変える
+_RE_UNSAFE_TOPIC_CHAR = re.compile(r"[^\w\-（）()\[\]]")
+
+# 発言の各行頭にある見出し・引用・箇条書き記号（Markdown ログでは取り除く）
+_RE_LINE_MARKER = re.compile(r"^\s*[#>\-\*\u30fb・]+", re.MULTILINE)
+
+# ログ1行ごとに JSONEncoder を生成しないよう、設定済みのエンコーダを使い回す（出力は json.dumps と同一）
+_json_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+# 直近に整形した (エポック秒, ISO 文字列)。同じ秒のレコードは整形済み文字列を共有する
+_last_stamp = (0, "")
+
+
+def now_iso() -> str:
+    """ローカル時刻の ISO 8601 文字列（秒精度）を返す。同じ秒の間は整形済みの文字列を使い回す。"""
+
+    global _last_stamp
+    sec = int(time.time())
+    cached_sec, text = _last_stamp
+    if sec != cached_sec:
+        # datetime オブジェクトを作らず、C 実装の strftime で秒精度の ISO 形式に整形する
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _last_stamp = (sec, text)
+    return text
+
+
+def _strip_line_markers(text: str) -> str:
+    """各行頭の記号を取り除く（記号を1つも含まない発言は正規表現を通さずそのまま返す）。"""
+
+    if "#" in text or ">" in text or "-" in text or "*" in text or "\u30fb" in text:
+        return _RE_LINE_MARKER.sub("", text)
+    return text
+
+
+def _close_handles(handles: Dict[Path, TextIO]) -> None:
+    """開いている追記ハンドルをすべて閉じる（バッファの内容はここで書き出される）。"""
+
+    while handles:
+        _, f = handles.popitem()
+        f.close()
 
 
 class LiveLogWriter:
@@ -24,7 +69,7 @@ class LiveLogWriter:
         enable_jsonl: bool = True,
     ):
         ts = datetime.now().strftime("%Y%m%d-%H%M%S")
-        safe_topic = "".join(c if c.isalnum() or c in "-_（）()[]" else "_" for c in topic)[:80]
+        safe_topic = _RE_UNSAFE_TOPIC_CHAR.sub("_", topic[:80])
         base_dir = Path(outdir or f"logs/{ts}_{safe_topic}")
         base_dir.mkdir(parents=True, exist_ok=True)
         self.dir = base_dir
@@ -41,21 +86,28 @@ class LiveLogWriter:
         self.phase_summary_log = base_dir / summary_probe_phase_filename
         self.semantic_core_json = base_dir / "semantic_core.json"
         self.semantic_core_jsonl = base_dir / "semantic_core.jsonl"
-
-        # ヘッダを書いておく
+        # 追記先ごとに開いたままのファイルハンドル（イベントごとの open/close を避ける）。
+        # 並列実行中のスレッドから追記されても行が混ざらないようロックで保護する。
+        # 停止シグナルのハンドラは追記中のメインスレッドに割り込んで close() するため再入可能にする
+        self._handles: Dict[Path, TextIO] = {}
+        self._lock = threading.RLock()
+        # close() が呼ばれないまま破棄・終了した場合も、バッファ内の行を書き出して閉じる
+        weakref.finalize(self, _close_handles, self._handles)
+
+        # ヘッダを書いておく（開いたハンドルはそのまま以降の追記に使う）
         if self.md:
-            with self.md.open("w", encoding="utf-8", newline="\n") as f:
-                if self.ui_minimal:
-                    f.write(f"【Topic】{topic}（開始: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}）\n\n")
-                else:
-                    f.write(
-                        (
-                            f"# Topic: {topic}\n\n"
-                            f"- 開始: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                            "- ログ形式: ラウンドごとに追記\n\n"
-                        )
+            f = self._handles[self.md] = self.md.open("w", encoding="utf-8", newline="\n")
+            if self.ui_minimal:
+                f.write(f"【Topic】{topic}（開始: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}）\n\n")
+            else:
+                f.write(
+                    (
+                        f"# Topic: {topic}\n\n"
+                        f"- 開始: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                        "- ログ形式: ラウンドごとに追記\n\n"
                     )
-                f.flush()
+                )
+            f.flush()
         # JSONLは空ファイル作成のみ
         if self.jsonl:
             self.jsonl.touch()
@@ -78,12 +130,9 @@ class LiveLogWriter:
     ):
         """1発言分のログを追記する。"""
 
-        line = content.strip()
-        line = re.sub(r"^\s*[#>\-\*\u30fb・]+", "", line, flags=re.MULTILINE)
+        line = _strip_line_markers(content.strip())
         if self.md:
-            with self.md.open("a", encoding="utf-8", newline="\n") as f:
-                f.write(f"{speaker}: {line}\n\n")
-                f.flush()
+            self._append_markdown(f"{speaker}: {line}\n\n")
         record = self._create_record(
             "turn",
             {
@@ -106,23 +155,17 @@ class LiveLogWriter:
             record = asdict(payload)
         else:
             record = dict(payload)
-        with self.phase_log.open("a", encoding="utf-8", newline="") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            f.flush()
+        self._write_jsonl(self.phase_log, record)
 
     def append_thoughts(self, payload: Dict):
         """思考ログを JSONL に追記する（UI には表示しない）。"""
 
-        with self.thoughts_log.open("a", encoding="utf-8", newline="\n") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
-            f.flush()
+        self._write_jsonl(self.thoughts_log, payload)
 
     def append_control(self, payload: Dict):
         """KPI コントローラの状態を記録する。"""
 
-        with (self.dir / "control.jsonl").open("a", encoding="utf-8", newline="") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
-            f.flush()
+        self._write_jsonl(self.dir / "control.jsonl", payload)
 
     def append_summary(
         self,
@@ -140,13 +183,9 @@ class LiveLogWriter:
         if self.md:
             if self.ui_minimal:
                 tag = "要約"
-                with self.md.open("a", encoding="utf-8", newline="\n") as f:
-                    f.write(f"（{tag}）{text}\n\n")
-                    f.flush()
+                self._append_markdown(f"（{tag}）{text}\n\n")
             else:
-                with self.md.open("a", encoding="utf-8", newline="\n") as f:
-                    f.write(f"### Round {round_idx} 要約\n\n{text}\n\n")
-                    f.flush()
+                self._append_markdown(f"### Round {round_idx} 要約\n\n{text}\n\n")
         record = self._create_record(
             "summary",
             {
@@ -163,16 +202,12 @@ class LiveLogWriter:
     def append_summary_probe(self, payload: Dict[str, Any]) -> None:
         """要約プローブの結果を JSONL 形式で追記する。"""
 
-        with self.summary_probe_log.open("a", encoding="utf-8", newline="\n") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
-            f.flush()
+        self._write_jsonl(self.summary_probe_log, payload)
 
     def append_phase_summary(self, payload: Dict[str, Any]) -> None:
         """フェーズ単位の要約結果を JSONL 形式で追記する。"""
 
-        with self.phase_summary_log.open("a", encoding="utf-8", newline="\n") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
-            f.flush()
+        self._write_jsonl(self.phase_summary_log, payload)
 
     def write_semantic_core(self, state: Dict[str, Any]) -> None:
         """セマンティックコアの最新状態を JSON で保存する。"""
@@ -190,28 +225,29 @@ class LiveLogWriter:
         """セマンティックコアの状態スナップショットを JSONL 追記する。"""
 
         record: Dict[str, Any] = {
-            "ts": datetime.now().isoformat(timespec="seconds"),
+            "ts": now_iso(),
             "state": state,
         }
         if reason:
             record["reason"] = reason
         if metadata:
             record["meta"] = dict(metadata)
-        with self.semantic_core_jsonl.open("a", encoding="utf-8", newline="") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            f.flush()
+        self._write_jsonl(self.semantic_core_jsonl, record)
 
     def iter_summary_probe(self) -> Iterator[Dict[str, Any]]:
         """要約プローブログから JSON レコードを順に取得する。"""
 
-        with self.summary_probe_log.open("r", encoding="utf-8") as f:
+        # バッファに残った追記分も読めるよう、先に書き出しておく
+        self.flush()
+        # バイト列のまま json.loads へ渡し、テキストデコードと strip による行のコピーを省く
+        # （json.loads は UTF-8 のバイト列と前後の空白をそのまま受け付ける）
+        with self.summary_probe_log.open("rb") as f:
             for line in f:
-                entry = line.strip()
-                if not entry:
+                if line.isspace():
                     continue
                 try:
-                    yield json.loads(entry)
-                except json.JSONDecodeError as exc:  # pragma: no cover - 想定外のログ破損
+                    yield json.loads(line)
+                except ValueError as exc:  # pragma: no cover - 想定外のログ破損（不正な UTF-8 を含む）
                     raise ValueError("summary_probe ログの形式が不正です。") from exc
 
     def append_final(self, final_text: str):
@@ -219,12 +255,10 @@ class LiveLogWriter:
 
         text = final_text.strip()
         if self.md:
-            with self.md.open("a", encoding="utf-8", newline="\n") as f:
-                if self.ui_minimal:
-                    f.write("【Final】\n" + text + "\n")
-                else:
-                    f.write("## Final Decision / 合意案\n\n" + text + "\n")
-                f.flush()
+            if self.ui_minimal:
+                self._append_markdown("【Final】\n" + text + "\n")
+            else:
+                self._append_markdown("## Final Decision / 合意案\n\n" + text + "\n")
         record = self._create_record("final", {"final": final_text})
         self._append_jsonl(record)
 
@@ -232,11 +266,9 @@ class LiveLogWriter:
         """KPI 情報を Markdown と JSON に保存する。"""
 
         if self.md:
-            with self.md.open("a", encoding="utf-8", newline="\n") as f:
-                f.write("\n=== KPI ===\n")
-                for key, value in kpi.items():
-                    f.write(f"- {key}: {value}\n")
-                f.flush()
+            lines = ["\n=== KPI ===\n"]
+            lines.extend(f"- {key}: {value}\n" for key, value in kpi.items())
+            self._append_markdown("".join(lines))
         (self.dir / "kpi.json").write_text(
             json.dumps(kpi, ensure_ascii=False, indent=2),
             encoding="utf-8",
@@ -255,9 +287,57 @@ class LiveLogWriter:
 
         if not self.jsonl or not self.enable_jsonl:
             return
-        with self.jsonl.open("a", encoding="utf-8", newline="\n") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            f.flush()
+        # 実行中のライブログは UI が追跡するため、1行ごとに OS へ渡す
+        self._write_jsonl(self.jsonl, record, flush=True)
+
+    def _write_jsonl(self, path: Path, record: Dict[str, Any], *, flush: bool = False) -> None:
+        """レコードを1行の JSON に変換して追記する（JSONL 出力はすべてここを通す）。"""
+
+        self._append_line(path, _json_dumps(record) + "\n", flush=flush)
+
+    def _append_markdown(self, text: str) -> None:
+        """Markdown ログへ追記する（人が追いかけて読むログなので、イベントごとに書き出す）。"""
+
+        if self.md:
+            self._append_line(self.md, text, flush=True)
+
+    def _append_line(self, path: Path, line: str, *, flush: bool = False) -> None:
+        """開いたままのハンドルへ1行追記する。
+
+        ``flush`` を指定しない補助ログはバッファに溜め、`flush()`/`close()` でまとめて書き出す。
+        """
+
+        with self._lock:
+            f = self._handles.get(path)
+            if f is None:
+                f = self._handles[path] = path.open("a", encoding="utf-8", newline="\n")
+            f.write(line)
+            if flush:
+                f.flush()
+
+    def flush(self) -> None:
+        """バッファに溜まった追記内容をすべてファイルへ書き出す。"""
+
+        with self._lock:
+            for f in self._handles.values():
+                f.flush()
+
+    def checkpoint(self) -> None:
+        """書き出したうえで fsync し、区切りの時点までのログをディスクへ確定させる。
+
+        イベントごとの flush は OS へ渡すだけなので、会議終了などの節目でのみ呼び出す。
+        """
+
+        with self._lock:
+            for f in self._handles.values():
+                f.flush()
+                os.fsync(f.fileno())
+
+    def close(self) -> None:
+        """開いたままの追記ハンドルを閉じる（閉じた後に追記されれば開き直す）。"""
+
+        with self._lock:
+            _close_handles(self._handles)
 
     def _create_record(
         self,
@@ -272,7 +352,7 @@ class LiveLogWriter:
         """JSONL レコードを共通形式で生成する。"""
 
         record: Dict[str, Any] = {
-            "ts": datetime.now().isoformat(timespec="seconds"),
+            "ts": now_iso(),
             "type": event_type,
         }
         record.update(payload)
@@ -303,4 +383,4 @@ class LiveLogWriter:
         return payload
 
 
-__all__ = ["LiveLogWriter"]
+__all__ = ["LiveLogWriter", "now_iso"]
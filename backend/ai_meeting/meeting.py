@@ -11,14 +11,14 @@ import time
 import traceback
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ._textutil import cached_token_set, jaccard, token_set
 from .config import AgentConfig, MeetingConfig, Turn
 from .controllers import KPIFeedback, Monitor, PendingTracker, PhaseEvent, ShockEngine
 from .evaluation import KPIEvaluator
 from .llm import LLMRequest, OllamaBackend, OpenAIBackend
-from .logging import LiveLogWriter
+from .logging import LiveLogWriter, now_iso
 from .metrics import MetricsLogger
 from .semantic_core import SemanticCoreStore
 from .summary_probe import SummaryProbe
@@ -370,8 +370,8 @@ class Meeting:
         """フェーズイベントのログ用ペイロードを生成する。"""
 
         payload: Dict = {
-            "ts": datetime.now().isoformat(timespec="seconds"),
-            "event": asdict(event),
+            "ts": now_iso(),
+            "event": event.to_dict(),
         }
         if state:
             payload["phase"] = self._phase_state_to_dict(state)
@@ -457,12 +457,8 @@ class Meeting:
             adjustments[param] = applied
             if param == "temperature":
                 self.temperature = new_value
-            elif param == "select_temp":
-                self.cfg.select_temp = new_value
-            elif param == "sim_penalty":
-                self.cfg.sim_penalty = new_value
-            elif param == "cooldown":
-                self.cfg.cooldown = new_value
+            elif param in ("select_temp", "sim_penalty", "cooldown"):
+                self.cfg.tune(param, new_value)
 
         self._shock_adjustments = adjustments
         return adjustments
@@ -502,7 +498,7 @@ class Meeting:
             event.shock_used = mode
 
         record: Dict[str, Any] = {
-            "ts": datetime.now().isoformat(timespec="seconds"),
+            "ts": now_iso(),
             "type": "shock_activation",
             "mode": mode,
             "reason": reason,
@@ -522,9 +518,8 @@ class Meeting:
 
         if self._shock_baseline:
             self.temperature = self._shock_baseline.get("temperature", self.temperature)
-            self.cfg.select_temp = self._shock_baseline.get("select_temp", self.cfg.select_temp)
-            self.cfg.sim_penalty = self._shock_baseline.get("sim_penalty", self.cfg.sim_penalty)
-            self.cfg.cooldown = self._shock_baseline.get("cooldown", self.cfg.cooldown)
+            for param in ("select_temp", "sim_penalty", "cooldown"):
+                self.cfg.tune(param, self._shock_baseline.get(param, getattr(self.cfg, param)))
         self._shock_baseline = {}
         self._shock_adjustments = {}
         self._shock_hint = None
@@ -978,6 +973,12 @@ class Meeting:
             self._agent_personality_memory[agent.name] = profile_text
 
     def _think(self, agent: AgentConfig, last_summary: str) -> str:
+        req = self._think_request(agent, last_summary)
+        return self._enforce_chat_constraints(self.backend.generate(req)).strip()
+
+    def _think_request(self, agent: AgentConfig, last_summary: str) -> LLMRequest:
+        """エージェントの思考生成リクエストを組み立てる。"""
+
         sys = (
             "あなたは会議参加者です。これは『内面の思考』であり出力は他者に公開されません。"
             "短く（1〜2文、日本語）、次の一手として有効な案だけを書いてください。"
@@ -1029,14 +1030,22 @@ class Meeting:
         if shared_block:
             user_lines.insert(1, shared_block)
         user = "\n".join(user_lines)
-        req = LLMRequest(
+        return LLMRequest(
             system=sys,
             messages=[{"role": "user", "content": user}],
             temperature=min(0.9, self.temperature + 0.1),
             max_tokens=120,
         )
-        return self._enforce_chat_constraints(self.backend.generate(req)).strip()
 
+    def _think_all(self, agents: List[AgentConfig], last_summary: str) -> Dict[str, str]:
+        """全エージェントの思考を生成する（並列化は backend.generate_many に任せる）。"""
+
+        reqs = [self._think_request(ag, last_summary) for ag in agents]
+        results = self.backend.generate_many(reqs)
+        return {
+            ag.name: self._enforce_chat_constraints(text).strip()
+            for ag, text in zip(agents, results)
+        }
 
     def _judge_thoughts(
         self,
@@ -1894,14 +1903,14 @@ class Meeting:
 
             flow_summary = self._conversation_summary()
             if self.cfg.think_mode:
-                thoughts: Dict[str, str] = {ag.name: self._think(ag, last_summary) for ag in self.cfg.agents}
+                thoughts: Dict[str, str] = self._think_all(self.cfg.agents, last_summary)
                 verdict = self._judge_thoughts(thoughts, last_summary, flow_summary)
                 previous_speaker = self.history[-1].speaker if self.history else None
                 winner_name = self._resolve_winner(
                     verdict, previous_speaker, global_turn
                 )
                 verdict["resolved_winner"] = winner_name
-                winner = next((a for a in self.cfg.agents if a.name == winner_name), self.cfg.agents[0])
+                winner = self.cfg.find_agent(winner_name) or self.cfg.agents[0]
                 spoken_text = self._speak_from_thought(
                     winner, thoughts.get(winner.name, "")
                 )
@@ -2058,8 +2067,9 @@ class Meeting:
                             s -= self.cfg.cooldown
                     agent_last = last_utterances.get(ag.name)
                     if sim_tokens_recent and agent_last:
+                        # 各自の直近発言は次に話すまで変わらないため、キャッシュ済みの集合を使う
                         sim = self._similarity_tokens(
-                            self._token_set(agent_last),
+                            cached_token_set(agent_last),
                             sim_tokens_recent,
                         )
                         s -= self.cfg.sim_penalty * sim
@@ -2074,7 +2084,7 @@ class Meeting:
             last_summary = self._dedupe_bullets(summary_payload.get("summary", ""))
             summary_payload["summary"] = last_summary
             self._record_agent_memory(
-                [ag.name for ag in self.cfg.agents],
+                self.cfg.agent_names,
                 summary_payload,
                 speaker_name=current_speaker.name,
             )
@@ -2138,7 +2148,7 @@ class Meeting:
                         shock_reason = fb.get("shock_reason") or shock_reason
                     self._activate_shock(metrics_payload or None, shock_reason)
                 if fb and (self.cfg.kpi_auto_prompt or self.cfg.kpi_auto_tune):
-                    rec = {"ts": datetime.now().isoformat(timespec="seconds"), "type": "kpi_control"}
+                    rec = {"ts": now_iso(), "type": "kpi_control"}
                     rec.update(fb)
                     self.logger.append_control(rec)
                     # 1) 隠しプロンプト
@@ -2150,12 +2160,8 @@ class Meeting:
                         for key, val in fb["tune"].items():
                             if key == "shock_mode" and self._shock_engine:
                                 self._shock_engine.mode = val
-                            elif key == "sim_penalty":
-                                self.cfg.sim_penalty = clamp(self.cfg.sim_penalty + val[1], val[2], val[3])
-                            elif key == "select_temp":
-                                self.cfg.select_temp = clamp(self.cfg.select_temp + val[1], val[2], val[3])
-                            elif key == "cooldown":
-                                self.cfg.cooldown = clamp(self.cfg.cooldown + val[1], val[2], val[3])
+                            elif key in ("sim_penalty", "select_temp", "cooldown"):
+                                self.cfg.tune(key, clamp(getattr(self.cfg, key) + val[1], val[2], val[3]))
             except Exception:
                 traceback.print_exc()
 
@@ -2165,6 +2171,9 @@ class Meeting:
                 if self._ctrl_ttl == 0:
                     self._ctrl_hint = None
 
+            # ラウンドの区切りで、バッファに溜まった補助ログも含めてディスクへ確定させる
+            self.logger.checkpoint()
+
             if not self._test_mode:
                 time.sleep(0.2)
 
@@ -2240,6 +2249,7 @@ class Meeting:
         banner("Final Decision / 合意案")
         safe_console_print(final)
         self.logger.append_final(final)
+        self.logger.checkpoint()
 
         # Step6: KPI 評価と保存（最後の Meeting クラスにも入れる）
         kpi_result: Optional[Dict] = None
@@ -2253,6 +2263,7 @@ class Meeting:
             )
         except Exception as e:
             safe_console_print(f"[KPI] 評価で例外: {e}")
+        self.logger.checkpoint()
 
         live_paths = []
         if self.logger.md:
@@ -2307,6 +2318,8 @@ class Meeting:
                 base_dir / self.cfg.summary_probe_phase_filename
             )
         files = {key: _relative(path) for key, path in artifact_candidates.items()}
+        # meeting_result.json の出現で完了と判定されるため、先に全ログを確定させておく
+        self.logger.checkpoint()
         with result_path.open("w", encoding="utf-8") as f:
             json.dump(
                 {
@@ -2318,7 +2331,7 @@ class Meeting:
                     "phase_goal": self.cfg.phase_goal,
                     "resolve_phase": self.cfg.resolve_phase,
                     "agents": [a.model_dump() for a in self.cfg.agents],
-                    "turns": [t.__dict__ for t in self.history],
+                    "turns": [asdict(t) for t in self.history],
                     "phases": self._serialize_phases(),
                     "semantic_core": self._semantic_core_store.to_dict(),
                     "final": final,
@@ -2329,6 +2342,7 @@ class Meeting:
                 ensure_ascii=False,
                 indent=2,
             )
+        self.logger.close()
         # メトリクス停止＆グラフ作成
         try:
             self.metrics.stop()
@@ -2443,7 +2457,7 @@ class Meeting:
                 last_summary = self._dedupe_bullets(summary_payload.get("summary", ""))
                 summary_payload["summary"] = last_summary
                 self._record_agent_memory(
-                    [ag.name for ag in self.cfg.agents],
+                    self.cfg.agent_names,
                     summary_payload,
                     speaker_name=agent.name,
                 )
@@ -2492,6 +2506,8 @@ class Meeting:
                     resolved = True
                     break
 
+            self.logger.checkpoint()
+
             if resolved or limit_hit:
                 break
 
@@ -2569,20 +2585,13 @@ class Meeting:
         lines = [t.content for t in self.history[-window:]]
         return "\n".join(lines)
 
-    def _token_set(self, text: str) -> set:
+    def _token_set(self, text: str) -> frozenset:
         # 記号・数字を落として簡易トークン集合に（日本語/英語混在でもそこそこ効く）
-        t = re.sub(r"[0-9]+", " ", text)
-        t = re.sub(r"[^\w\u3040-\u30ff\u4e00-\u9fff]+", " ", t, flags=re.UNICODE)
-        toks = [w for w in t.lower().split() if len(w) > 1]
-        return set(toks)
+        return token_set(text)
 
-    def _similarity_tokens(self, a: set, b: set) -> float:
+    def _similarity_tokens(self, a: frozenset, b: frozenset) -> float:
         # Jaccard 類似（0〜1）
-        if not a or not b:
-            return 0.0
-        inter = len(a & b)
-        union = len(a | b)
-        return inter / union
+        return jaccard(a, b)
 
     def _softmax_pick(self, pairs: List[Tuple[str, float]], temp: float) -> str:
         # pairs: [(name, score), ...] -> name をソフトマックス抽選
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import BackgroundTasks, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, ConfigDict
 from backend.settings import settings
@@ -22,6 +23,12 @@ app.mount("/logs", StaticFiles(directory=str(LOGS_DIR)), name="logs")
 
 _TIMESTAMP_PREFIX_RE = re.compile(r"^([0-9]{8}-[0-9]{6})")
 
+ResultEntry = Tuple[Tuple[int, str, float, str], Dict[str, Any]]
+
+# 結果一覧のエントリキャッシュ（meeting_result.json のパス -> ((mtime_ns, size), エントリ)）
+_result_entry_cache: Dict[str, Tuple[Tuple[int, int], Optional[ResultEntry]]] = {}
+_result_entry_cache_lock = threading.Lock()
+
 # ローカルのフロントエンドだけ許可（公開しない前提）
 app.add_middleware(
     CORSMiddleware,
@@ -451,7 +458,14 @@ class StartMeetingOut(BaseModel):
     log_id: Optional[str] = None
 
 @app.post("/meetings", response_model=StartMeetingOut)
-def start_meeting(body: StartMeetingIn, bg: BackgroundTasks):
+async def start_meeting(body: StartMeetingIn, bg: BackgroundTasks):
+    # ディレクトリ作成やプロセス起動はブロッキングなのでスレッドプールで実行する
+    return await run_in_threadpool(_launch_meeting, body)
+
+
+def _launch_meeting(body: StartMeetingIn) -> StartMeetingOut:
+    """outdir を用意して CLI プロセスを起動し、レジストリへ登録する。"""
+
     # ルート/ログパスを絶対パス化
     REPO_ROOT = Path(__file__).resolve().parent.parent
     LOGS_ROOT = REPO_ROOT / "logs"
@@ -529,26 +543,33 @@ def list_meetings():
         return {"items": items}
 
 # meeting_result.json の有効性を確認するヘルパー
-def _has_valid_meeting_result(path: Path) -> bool:
-    """meeting_result.json が空ファイル・不正ファイルではないか判定する。"""
+def _load_meeting_result(path: Path) -> Optional[Dict[str, Any]]:
+    """meeting_result.json を1回だけ読み込み、JSONオブジェクトなら返す。"""
 
-    if not path.exists() or not path.is_file():
-        return False
+    if not path.is_file():
+        return None
 
     try:
         if path.stat().st_size <= 0:
-            return False
-    except OSError:
-        return False
-
-    try:
-        with path.open("r", encoding="utf-8") as fp:
-            data = json.load(fp)
-    except (OSError, json.JSONDecodeError):
-        return False
+            return None
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
 
     if not isinstance(data, dict):
-        return False
+        return None
+    return data
+
+
+def _has_valid_meeting_result(path: Path) -> bool:
+    """meeting_result.json が空ファイル・不正ファイルではないか判定する。"""
+
+    data = _load_meeting_result(path)
+    return data is not None and _is_meaningful_meeting_result(data)
+
+
+def _is_meaningful_meeting_result(data: Dict[str, Any]) -> bool:
+    """読み込み済みの結果JSONに表示可能な中身があるか判定する。"""
 
     final_text = data.get("final")
     if isinstance(final_text, str) and final_text.strip():
@@ -600,20 +621,38 @@ def _extract_started_at_from_payload(payload: Dict[str, Any], directory_name: st
     return ""
 
 
-def _collect_result_entry(log_dir: Path) -> Optional[Tuple[Tuple[int, str, float, str], Dict[str, Any]]]:
-    """単一ディレクトリから結果API用のエントリを生成する。"""
+def _collect_result_entry(log_dir: Path) -> Optional[ResultEntry]:
+    """単一ディレクトリから結果API用のエントリを生成する。
 
-    result_path = log_dir / "meeting_result.json"
-    if not _has_valid_meeting_result(result_path):
-        return None
+    meeting_result.json の更新時刻とサイズが前回と同じなら、解析済みのエントリを再利用する。
+    """
 
+    result_path = log_dir / "meeting_result.json"
+    cache_key = str(result_path)
     try:
-        with result_path.open("r", encoding="utf-8") as fp:
-            payload = json.load(fp)
-    except (OSError, json.JSONDecodeError):
+        stat = result_path.stat()
+    except OSError:
+        with _result_entry_cache_lock:
+            _result_entry_cache.pop(cache_key, None)
         return None
 
-    if not isinstance(payload, dict):
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _result_entry_cache_lock:
+        cached = _result_entry_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    entry = _build_result_entry(log_dir, result_path, stat.st_mtime)
+    with _result_entry_cache_lock:
+        _result_entry_cache[cache_key] = (signature, entry)
+    return entry
+
+
+def _build_result_entry(log_dir: Path, result_path: Path, mtime: float) -> Optional[ResultEntry]:
+    """meeting_result.json を解析して結果API用のエントリを組み立てる。"""
+
+    payload = _load_meeting_result(result_path)
+    if payload is None or not _is_meaningful_meeting_result(payload):
         return None
 
     topic_raw = payload.get("topic")
@@ -624,11 +663,6 @@ def _collect_result_entry(log_dir: Path) -> Optional[Tuple[Tuple[int, str, float
 
     started_at = _extract_started_at_from_payload(payload, log_dir.name)
 
-    try:
-        mtime = result_path.stat().st_mtime
-    except OSError:
-        mtime = 0.0
-
     sort_key = (
         1 if started_at else 0,
         started_at,
@@ -655,13 +689,19 @@ def list_results():
     except OSError:
         log_dirs = []
 
-    entries: List[Tuple[Tuple[int, str, float, str], Dict[str, Any]]] = []
+    entries: List[ResultEntry] = []
     for log_dir in log_dirs:
         collected = _collect_result_entry(log_dir)
         if collected is None:
             continue
         entries.append(collected)
 
+    # 削除・ローテートされたディレクトリのエントリは今回の走査に現れないので捨てる
+    scanned = {str(log_dir / "meeting_result.json") for log_dir in log_dirs}
+    with _result_entry_cache_lock:
+        for stale_key in _result_entry_cache.keys() - scanned:
+            del _result_entry_cache[stale_key]
+
     entries.sort(key=lambda item: item[0], reverse=True)
     return {"items": [item for _, item in entries]}
 
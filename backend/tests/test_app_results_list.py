@@ -1,5 +1,6 @@
 from pathlib import Path
 import json
+import shutil
 import sys
 import types
 
@@ -104,3 +105,58 @@ def test_list_results_handles_missing_logs_directory(monkeypatch, tmp_path):
     items = data.get("items")
     assert isinstance(items, list)
     assert items == []
+
+
+def test_list_results_reuses_entry_until_file_changes(monkeypatch, tmp_path):
+    # 更新のない meeting_result.json は再解析せず、更新されたら読み直すことを検証
+    logs_dir = _prepare_logs(tmp_path, monkeypatch)
+    meeting_dir = logs_dir / "20240201-090000_cache"
+    meeting_dir.mkdir()
+    result_path = meeting_dir / "meeting_result.json"
+    result_path.write_text(json.dumps({"topic": "初版", "final": "結論A"}), encoding="utf-8")
+
+    loads = []
+    original_load = app_module._load_meeting_result
+
+    def _counting_load(path):
+        loads.append(path)
+        return original_load(path)
+
+    monkeypatch.setattr(app_module, "_load_meeting_result", _counting_load)
+
+    with TestClient(app_module.app) as client:
+        first = client.get("/results").json()["items"]
+        second = client.get("/results").json()["items"]
+        result_path.write_text(
+            json.dumps({"topic": "改訂版", "final": "結論B（追記あり）"}), encoding="utf-8"
+        )
+        third = client.get("/results").json()["items"]
+
+    assert first == second
+    assert len(loads) == 2
+    assert third[0]["topic"] == "改訂版"
+
+
+def test_list_results_drops_cache_for_removed_directories(monkeypatch, tmp_path):
+    # 削除されたディレクトリや結果ファイルのキャッシュが残り続けないことを検証
+    logs_dir = _prepare_logs(tmp_path, monkeypatch)
+    monkeypatch.setattr(app_module, "_result_entry_cache", {})
+    kept_dir = logs_dir / "20240301-090000_kept"
+    removed_dir = logs_dir / "20240301-100000_removed"
+    emptied_dir = logs_dir / "20240301-110000_emptied"
+    for meeting_dir in (kept_dir, removed_dir, emptied_dir):
+        meeting_dir.mkdir()
+        (meeting_dir / "meeting_result.json").write_text(
+            json.dumps({"topic": meeting_dir.name, "final": "結論"}), encoding="utf-8"
+        )
+
+    with TestClient(app_module.app) as client:
+        assert len(client.get("/results").json()["items"]) == 3
+        assert len(app_module._result_entry_cache) == 3
+
+        shutil.rmtree(removed_dir)
+        (emptied_dir / "meeting_result.json").unlink()
+        items = client.get("/results").json()["items"]
+
+    assert [item["topic"] for item in items] == [kept_dir.name]
+    assert list(app_module._result_entry_cache) == [str(kept_dir / "meeting_result.json")]
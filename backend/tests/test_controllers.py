@@ -0,0 +1,230 @@
+"""`backend.ai_meeting.controllers` の制御クラスに関するテスト。"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.ai_meeting._textutil import cached_token_set, token_set  # noqa: E402
+from backend.ai_meeting.config import AgentConfig, MeetingConfig, Turn  # noqa: E402
+from backend.ai_meeting.controllers import (  # noqa: E402
+    KPIFeedback,
+    Monitor,
+    PendingTracker,
+    PhaseEvent,
+    ShockEngine,
+)
+
+
+def _make_cfg(**overrides) -> MeetingConfig:
+    """監視テスト用の最小構成を返す。"""
+
+    params = dict(
+        topic="監視テスト",
+        agents=[
+            AgentConfig(name="Alice", system="会議参加者"),
+            AgentConfig(name="Bob", system="会議参加者"),
+        ],
+    )
+    params.update(overrides)
+    return MeetingConfig(**params)
+
+
+def _full_cohesion(turns) -> float:
+    """全ペアを毎回計算する素朴な実装でまとまり度を求める。"""
+
+    sets = [Monitor._token_set(t.content) for t in turns]
+    sims = [
+        Monitor._jacc(sets[i], sets[j])
+        for i in range(len(sets) - 1)
+        for j in range(i + 1, len(sets))
+    ]
+    return sum(sims) / len(sims)
+
+
+@pytest.mark.parametrize("vocab_limit", [Monitor._VOCAB_LIMIT, 3])
+def test_monitor_cohesion_matches_full_recompute_on_sliding_window(vocab_limit):
+    """ペア類似度の再利用や語彙の作り直しがあっても、全ペア再計算と同じまとまり度になること。"""
+
+    # 閾値を 0 にして毎ターンイベントを発生させ、cohesion を観測できるようにする
+    cfg = _make_cfg(phase_cohesion_min=0.0, phase_unresolved_drop=0.0)
+    monitor = Monitor(cfg)
+    monitor._VOCAB_LIMIT = vocab_limit
+    contents = [
+        "予算 配分 検討 開始",
+        "予算 配分 見直し 提案",
+        "担当 期限 決定 予算",
+        "リスク 対策 検討 予算",
+        "配分 決定 担当 合意",
+        "次回 期限 確認 予算",
+        "予算 配分 見直し 提案",
+    ]
+    history = []
+    window = 4
+    for content in contents:
+        history.append(Turn(speaker="Alice", content=content))
+        monitor.observe(history, [3, 2], window)
+        event = monitor._current_event
+        if len(history) < 3:
+            assert event is None
+            continue
+        expected = round(_full_cohesion(history[-min(window, len(history)):]), 3)
+        assert event is not None
+        assert event.cohesion == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Aliceの見解: 予算配分を再検討（案A/案B）",
+        "担当:Bob 期限:9/30 KPI を 3 つ設定",
+        "İstanbul 会議 x y 12ab",
+        "",
+    ],
+)
+def test_token_set_matches_two_pass_substitution(text):
+    """1回の分割によるトークン化が、数字→記号の2段置換と同じ集合を返すこと。"""
+
+    t = re.sub(r"[0-9]+", " ", text)
+    t = re.sub(r"[^\w\u3040-\u30ff\u4e00-\u9fff]+", " ", t)
+    expected = {w for w in t.lower().split() if len(w) > 1}
+
+    assert token_set(text) == expected
+
+
+def test_sliding_window_tokenizes_each_turn_once():
+    """ウィンドウが重なっても、同じ発言の再トークン化はキャッシュで済むこと。"""
+
+    cached_token_set.cache_clear()
+    cfg = _make_cfg(kpi_window=3)
+    monitor = Monitor(cfg)
+    feedback = KPIFeedback(cfg)
+    history = []
+    for i in range(6):
+        history.append(Turn(speaker="Alice", content=f"論点{i} 予算 検討 案{i}"))
+        monitor.observe(history, [3, 3], 4)
+        feedback.assess(history, [3, 3])
+
+    assert cached_token_set.cache_info().misses == len(history)
+
+
+def test_phase_event_to_dict_matches_asdict():
+    """PhaseEvent.to_dict が dataclasses.asdict と同じ内容・キー順の辞書を返すこと。"""
+
+    event = PhaseEvent(
+        phase_id=2,
+        start_turn=5,
+        end_turn=9,
+        status="confirmed",
+        confidence=0.8,
+        summary="論点を整理",
+        reason="cohesion",
+        cohesion=0.42,
+        kind="resolve",
+    )
+
+    assert list(event.to_dict().items()) == list(asdict(event).items())
+
+
+def test_kpi_feedback_decision_density_and_stall():
+    """決定語の検出と未解決数の横ばい判定を確認する。"""
+
+    feedback = KPIFeedback(_make_cfg(kpi_window=4))
+    turns = [
+        Turn(speaker="Alice", content="方針を議論する"),
+        Turn(speaker="Bob", content="担当はBobに決定"),
+        Turn(speaker="Alice", content="期限は来週とする"),
+        Turn(speaker="Bob", content="懸念点を共有"),
+    ]
+
+    flat = feedback.assess(turns, [3, 3, 3, 3])
+    assert flat["metrics"]["decision_density"] == 0.5
+    assert flat["metrics"]["stall"] is True
+
+    for history in ([4, 3, 3, 2], [3, 3, 4, 4], [2, 3, 2, 2]):
+        assert feedback.assess(turns, history)["metrics"]["stall"] is False
+
+
+def test_pending_tracker_extracts_keyword_lines():
+    """残課題キーワードを含む行だけがラベルを除いて登録されること。"""
+
+    tracker = PendingTracker()
+    tracker.add_from_text(
+        "・残課題: 予算の再見積もり\n"
+        "進め方は合意済み\n"
+        "- リスク：納期遅延\n"
+        "改善案を次回までに用意する\n"
+    )
+
+    assert tracker.items == {"予算の再見積もり", "納期遅延", "改善案を次回までに用意する"}
+
+
+def test_monitor_skips_cohesion_when_no_trigger_is_possible(monkeypatch):
+    """未解決が減らずループもしないときは、全ペアの類似度計算を行わないこと。"""
+
+    monitor = Monitor(_make_cfg())
+    calls = []
+    original = monitor._window_cohesion
+
+    def _spy(recent, bits):
+        calls.append(len(recent))
+        return original(recent, bits)
+
+    monkeypatch.setattr(monitor, "_window_cohesion", _spy)
+    history = [Turn(speaker="Alice", content=f"論点{i} を整理 案{i}") for i in range(4)]
+
+    assert monitor.observe(history, [3, 3], 4) is None
+    assert calls == []
+
+    history.append(Turn(speaker="Bob", content="論点 を整理 合意"))
+    monitor.observe(history, [3, 1], 4)
+    assert calls == [4]
+
+
+def test_shock_random_mode_matches_uniform_draws():
+    """ランダム揺らぎが Random.uniform を用いた場合と同じ値になること。"""
+
+    engine = ShockEngine(_make_cfg(shock="random"))
+    engine._rng = random.Random(7)
+    reference = random.Random(7)
+
+    result = engine.generate({"random_span": 0.2})
+
+    expected = {
+        "temperature": round(reference.uniform(-0.2, 0.2), 3),
+        "select_temp": round(reference.uniform(-0.2, 0.2), 3),
+        "sim_penalty": round(reference.uniform(-0.2 * 0.6, 0.2 * 0.6), 3),
+        "cooldown": round(reference.uniform(-0.2 * 0.5, 0.2 * 0.5), 3),
+    }
+    assert result == {k: v for k, v in expected.items() if abs(v) >= 0.001}
+
+
+def test_shock_modes_dispatch_and_scale_with_severity():
+    """モード指定に応じて発散・収束方向の揺らぎが返ること。"""
+
+    engine = ShockEngine(_make_cfg(shock="explore"))
+
+    explore = engine.generate({"metrics": {"diversity": 0.0}})
+    assert explore == {
+        "temperature": 0.3,
+        "select_temp": 0.4,
+        "sim_penalty": -0.2,
+        "cooldown": -0.12,
+    }
+
+    exploit = engine.generate({"mode": "exploit", "metrics": {"decision_density": 0.2}})
+    assert exploit == {
+        "temperature": -0.14,
+        "select_temp": -0.175,
+        "sim_penalty": 0.09,
+        "cooldown": 0.075,
+    }
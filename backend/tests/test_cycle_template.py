@@ -0,0 +1,78 @@
+"""サイクル出力テンプレートの生成・解析に関するテスト。"""
+
+import json
+
+import pytest
+
+from backend.ai_meeting.cycle_template import (
+    _sanitize_text,
+    build_cycle_payload,
+    extract_cycle_text,
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("  予算を見直す  ", "予算を見直す"),
+        ("見出しと箇条書きを使わない", "とを使わない"),
+        # 先の語句を除去した結果として現れる禁止語も除去される
+        ("担見出し当を決める", "を決める"),
+        (None, ""),
+    ],
+)
+def test_sanitize_text_removes_forbidden_terms(text, expected):
+    """禁止語を語句順に除去し、前後の空白を落とすこと。"""
+
+    assert _sanitize_text(text, ("見出し", "箇条書き", "担当")) == expected
+
+
+def test_build_cycle_payload_uses_agent_json_and_sanitizes_entries():
+    """エージェントの JSON 出力を各ブロックに反映し、禁止語を取り除くこと。"""
+
+    agent_json = json.dumps(
+        {
+            "diverge": [{"hypothesis": "仮説A", "assumptions": ["前提1", "", "絵文字"]}],
+            "learn": ["気づき"],
+            "converge": [{"commit": "担当を決めて実施", "reason": "合意済み"}],
+            "next_goal": "次の論点",
+        },
+        ensure_ascii=False,
+    )
+
+    payload = json.loads(build_cycle_payload(3, "発散", "学び", agent_json, None))
+
+    assert payload == {
+        "cycle": 3,
+        "diverge": [{"hypothesis": "仮説A", "assumptions": ["前提1"]}],
+        "learn": [{"insight": "気づき", "why": "", "links": []}],
+        "converge": [{"commit": "を決めて実施", "reason": "合意済み"}],
+        "next_goal": "次の論点",
+    }
+
+
+def test_build_cycle_payload_falls_back_to_source_texts():
+    """エージェント出力が JSON でない場合、各ソース文から既定のエントリを組み立てること。"""
+
+    payload = json.loads(
+        build_cycle_payload(1, "仮説の種", "- 学び1\n・学び2\n", "素の発言", "次回目標")
+    )
+
+    assert payload["diverge"] == [{"hypothesis": "仮説の種", "assumptions": []}]
+    assert payload["learn"] == [
+        {"insight": "学び1", "why": "", "links": []},
+        {"insight": "学び2", "why": "", "links": []},
+    ]
+    assert payload["converge"] == [{"commit": "素の発言", "reason": ""}]
+    assert payload["next_goal"] == "次回目標"
+
+
+def test_extract_cycle_text_reads_fields_and_passes_through_plain_text():
+    """指定ブロックの本文を連結して返し、JSON でなければ本文をそのまま返すこと。"""
+
+    content = build_cycle_payload(1, "仮説", "学び", "結論", "")
+
+    assert extract_cycle_text(content) == "結論"
+    assert extract_cycle_text(content, "diverge") == "仮説"
+    assert extract_cycle_text("  ただの発言  ") == "ただの発言"
+    assert extract_cycle_text(None) == ""
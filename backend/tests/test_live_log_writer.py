@@ -0,0 +1,167 @@
+"""LiveLogWriter の追記挙動に関するテスト。"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from backend.ai_meeting import logging as live_logging
+from backend.ai_meeting.logging import LiveLogWriter
+
+
+def _read_jsonl(path):
+    """JSONL ファイルをレコードのリストとして読み込む。"""
+
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_jsonl_lines_are_visible_before_close_and_after_reopen(tmp_path):
+    """開いたままのハンドルでも各行が即座に読め、close 後の追記も失われないこと。"""
+
+    writer = LiveLogWriter("追記テスト", outdir=str(tmp_path))
+    writer.append_turn(1, 1, "Alice", "最初の発言")
+    writer.append_warning("注意")
+
+    records = _read_jsonl(writer.jsonl)
+    assert [r["type"] for r in records] == ["turn", "warning"]
+    assert records[0]["speaker"] == "Alice"
+
+    writer.close()
+    writer.append_final("合意案")
+    writer.close()
+
+    assert [r["type"] for r in _read_jsonl(writer.jsonl)] == ["turn", "warning", "final"]
+
+
+def test_timestamp_is_reused_within_second_and_refreshed_after(monkeypatch):
+    """同じ秒では整形済みの時刻を再利用し、秒が変われば更新すること。"""
+
+    now = [1_700_000_000.2]
+    monkeypatch.setattr(live_logging.time, "time", lambda: now[0])
+
+    first = live_logging.now_iso()
+    now[0] = 1_700_000_000.9
+    assert live_logging.now_iso() is first
+    assert first == datetime.fromtimestamp(1_700_000_000).isoformat(timespec="seconds")
+
+    now[0] = 1_700_000_001.0
+    assert live_logging.now_iso() == datetime.fromtimestamp(1_700_000_001).isoformat(
+        timespec="seconds"
+    )
+
+
+def test_auxiliary_logs_are_buffered_until_flush(tmp_path):
+    """補助ログは追記ごとには書き出さず、flush/close でまとめて反映されること。"""
+
+    writer = LiveLogWriter("補助ログテスト", outdir=str(tmp_path))
+    for i in range(3):
+        writer.append_thoughts({"agent": "Alice", "thought": f"案{i}"})
+    writer.append_control({"select_temp": 0.8})
+
+    assert writer.thoughts_log.read_text(encoding="utf-8") == ""
+
+    writer.flush()
+    assert [r["thought"] for r in _read_jsonl(writer.thoughts_log)] == ["案0", "案1", "案2"]
+
+    writer.close()
+    assert _read_jsonl(writer.dir / "control.jsonl") == [{"select_temp": 0.8}]
+
+
+def test_checkpoint_flushes_and_fsyncs_every_open_handle(tmp_path, monkeypatch):
+    """checkpoint は開いている全ハンドルを書き出して fsync すること。"""
+
+    synced = []
+    monkeypatch.setattr(live_logging.os, "fsync", synced.append)
+    writer = LiveLogWriter("チェックポイントテスト", outdir=str(tmp_path))
+    writer.append_turn(1, 1, "Alice", "発言")
+    writer.append_thoughts({"agent": "Alice", "thought": "案"})
+
+    writer.checkpoint()
+
+    assert len(synced) == 3  # Markdown・JSONL・思考ログ
+    assert _read_jsonl(writer.thoughts_log) == [{"agent": "Alice", "thought": "案"}]
+    writer.close()
+
+
+def test_summary_probe_iteration_sees_buffered_records(tmp_path):
+    """書き出し前の要約プローブ記録も iter_summary_probe で読めること。"""
+
+    writer = LiveLogWriter("要約プローブ読込テスト", outdir=str(tmp_path))
+    writer.append_summary_probe({"turn_index": 1, "summary": "差分"})
+
+    assert list(writer.iter_summary_probe()) == [{"turn_index": 1, "summary": "差分"}]
+    writer.close()
+
+
+def test_summary_probe_iteration_skips_blank_lines(tmp_path):
+    """空行や空白だけの行を読み飛ばし、前後の記録を順に返すこと。"""
+
+    writer = LiveLogWriter("要約プローブ空行テスト", outdir=str(tmp_path))
+    writer.summary_probe_log.write_text(
+        '{"turn_index": 1}\n\n  \r\n{"turn_index": 2, "summary": "結論"}',
+        encoding="utf-8",
+    )
+
+    assert list(writer.iter_summary_probe()) == [
+        {"turn_index": 1},
+        {"turn_index": 2, "summary": "結論"},
+    ]
+    writer.close()
+
+
+def test_markdown_turn_strips_line_markers_but_jsonl_keeps_content(tmp_path):
+    """Markdown では各行頭の記号を除き、JSONL には元の本文を残すこと。"""
+
+    writer = LiveLogWriter("記号除去テスト", outdir=str(tmp_path))
+    content = "- 案A を採用\n> 補足・詳細\n・次の論点"
+    writer.append_turn(1, 1, "Alice", content)
+
+    md = writer.md.read_text(encoding="utf-8")
+    assert md.endswith("Alice:  案A を採用\n 補足・詳細\n次の論点\n\n")
+    assert _read_jsonl(writer.jsonl)[0]["content"] == content
+    writer.close()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "予算の配分を検討し、次回までに担当を決める。",
+        "案A を採用\n  費用が低い\n\n納期が短い",
+        "A-1 案と B-2 案を比較\n  - 費用\n・納期",
+        "## 結論\n>* 引用内の箇条書き",
+        "",
+    ],
+)
+def test_strip_line_markers_matches_regex(text):
+    """記号を含まない発言の早期リターンがあっても、正規表現での置換と同じ結果になること。"""
+
+    assert live_logging._strip_line_markers(text) == live_logging._RE_LINE_MARKER.sub("", text)
+
+
+def test_default_directory_name_replaces_unsafe_topic_characters(tmp_path, monkeypatch):
+    """出力先未指定時は、議題の使えない文字を「_」に置き換えた名前で作成すること。"""
+
+    monkeypatch.chdir(tmp_path)
+    writer = LiveLogWriter("予算/配分: Q3 (案)【再】" + "長" * 100)
+
+    name = writer.dir.name
+    assert (tmp_path / writer.dir).is_dir()
+    assert writer.dir.parent.name == "logs"
+    assert name.split("_", 1)[1] == "予算_配分__Q3_(案)_再_" + "長" * 64
+    writer.close()
+
+
+def test_markdown_log_keeps_header_and_is_readable_after_each_event(tmp_path):
+    """Markdown ログはヘッダの後に追記され、各イベント直後から読めること。"""
+
+    writer = LiveLogWriter("Markdown テスト", outdir=str(tmp_path))
+    writer.append_summary(1, " 論点を整理した ")
+    assert writer.md.read_text(encoding="utf-8").endswith("（要約）論点を整理した\n\n")
+
+    writer.append_final("案A を採用")
+    writer.append_kpi({"progress": 0.5})
+    writer.close()
+
+    md = writer.md.read_text(encoding="utf-8")
+    assert md.startswith("【Topic】Markdown テスト（開始: ")
+    assert md.endswith("【Final】\n案A を採用\n\n=== KPI ===\n- progress: 0.5\n")
@@ -0,0 +1,214 @@
+"""`OllamaBackend` の HTTP 呼び出し周りを検証するテスト。"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("requests")
+
+from backend.ai_meeting.llm import LLMBackend, LLMRequest, OllamaBackend, OpenAIBackend
+
+
+class _FakeResponse:
+    def __init__(self, content: str):
+        self._content = content
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Dict[str, Any]:
+        return {"message": {"content": self._content}}
+
+
+class _FakeRequests:
+    """`requests.post` の呼び出しを記録するスタブ。"""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def post(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.calls.append({"url": url, **kwargs})
+        return _FakeResponse(f" 応答{len(self.calls)} ")
+
+
+def _backend(monkeypatch: pytest.MonkeyPatch, *, cache: bool) -> tuple[OllamaBackend, _FakeRequests]:
+    if cache:
+        monkeypatch.setenv("AI_MEETING_CACHE", "1")
+    else:
+        monkeypatch.delenv("AI_MEETING_CACHE", raising=False)
+    backend = OllamaBackend(model="mock", host="http://127.0.0.1:11434")
+    fake = _FakeRequests()
+    backend.requests = fake  # type: ignore[assignment]
+    return backend, fake
+
+
+def test_response_cache_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    """AI_MEETING_CACHE 未設定時は毎回 HTTP リクエストを送ること。"""
+
+    backend, fake = _backend(monkeypatch, cache=False)
+    req = LLMRequest(system="sys", messages=[{"role": "user", "content": "ping"}])
+
+    assert backend.generate(req) == "応答1"
+    assert backend.generate(req) == "応答2"
+    assert len(fake.calls) == 2
+
+
+def test_response_cache_reuses_identical_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """同一プロンプト・温度の再リクエストはキャッシュから返ること。"""
+
+    backend, fake = _backend(monkeypatch, cache=True)
+    req = LLMRequest(system="sys", messages=[{"role": "user", "content": "ping"}])
+
+    assert backend.generate(req) == "応答1"
+    assert backend.generate(req.model_copy()) == "応答1"
+    assert len(fake.calls) == 1
+
+    warmer = req.model_copy(update={"temperature": 0.9})
+    assert backend.generate(warmer) == "応答2"
+    other_system = req.model_copy(update={"system": "別の役割"})
+    assert backend.generate(other_system) == "応答3"
+    assert len(fake.calls) == 3
+
+
+def test_generate_many_preserves_request_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """並列送信しても応答が入力順に並ぶこと。"""
+
+    backend, fake = _backend(monkeypatch, cache=False)
+    fake.post = lambda url, **kwargs: _FakeResponse(  # type: ignore[method-assign]
+        json.loads(kwargs["data"])["messages"][-1]["content"]
+    )
+    reqs = [
+        LLMRequest(system="sys", messages=[{"role": "user", "content": f"q{i}"}])
+        for i in range(5)
+    ]
+
+    assert backend.generate_many(reqs) == [f"q{i}" for i in range(5)]
+
+
+def test_generate_posts_preencoded_utf8_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    """リクエストボディが UTF-8 の JSON バイト列として送信されること。"""
+
+    backend, fake = _backend(monkeypatch, cache=False)
+    req = LLMRequest(system="司会", messages=[{"role": "user", "content": "議題"}], temperature=0.3)
+
+    backend.generate(req)
+
+    call = fake.calls[-1]
+    assert call["url"] == "http://127.0.0.1:11434/api/chat"
+    assert call["headers"]["Content-Type"].startswith("application/json")
+    assert isinstance(call["data"], bytes)
+    assert "議題".encode("utf-8") in call["data"]
+    assert json.loads(call["data"]) == {
+        "model": "mock",
+        "messages": [
+            {"role": "system", "content": "司会"},
+            {"role": "user", "content": "議題"},
+        ],
+        "options": {"temperature": 0.3},
+        "stream": False,
+    }
+
+
+def test_backend_reuses_one_keep_alive_session() -> None:
+    """HTTP 呼び出しは接続を使い回すセッション経由で行い、同時送信数ぶんのプールを持つこと。"""
+
+    import requests
+
+    backend = OllamaBackend(model="mock", host="http://127.0.0.1:11434")
+
+    assert isinstance(backend.requests, requests.Session)
+    adapter = backend.requests.get_adapter(backend._chat_url)
+    assert adapter._pool_maxsize == backend.max_concurrency
+
+
+def test_base_generate_many_runs_concurrently_when_allowed() -> None:
+    """max_concurrency が 2 以上の実装は、基底の generate_many で同時に送信されること。"""
+
+    import threading
+
+    class _Barrier(LLMBackend):
+        max_concurrency = 3
+
+        def __init__(self) -> None:
+            self._barrier = threading.Barrier(3, timeout=5)
+
+        def generate(self, req: LLMRequest) -> str:
+            # 3件が同時に到達しなければ BrokenBarrierError で失敗する
+            self._barrier.wait()
+            return req.messages[-1]["content"]
+
+    reqs = [
+        LLMRequest(system="sys", messages=[{"role": "user", "content": f"q{i}"}])
+        for i in range(3)
+    ]
+
+    assert _Barrier().generate_many(reqs) == ["q0", "q1", "q2"]
+
+
+def test_generate_many_fails_fast_without_waiting_for_inflight_requests() -> None:
+    """1件が失敗したら、実行中の通信を待たず未着手の分も取り消して例外を返すこと。"""
+
+    import threading
+    import time
+
+    release = threading.Event()
+    started: List[str] = []
+
+    class _Failing(LLMBackend):
+        max_concurrency = 2
+
+        def generate(self, req: LLMRequest) -> str:
+            content = req.messages[-1]["content"]
+            started.append(content)
+            if content == "boom":
+                raise RuntimeError("backend error")
+            release.wait(timeout=10)
+            return content
+
+    reqs = [
+        LLMRequest(system="sys", messages=[{"role": "user", "content": content}])
+        for content in ("slow", "boom", "queued1", "queued2")
+    ]
+
+    began = time.monotonic()
+    try:
+        with pytest.raises(RuntimeError, match="backend error"):
+            _Failing().generate_many(reqs)
+        elapsed = time.monotonic() - began
+    finally:
+        release.set()
+
+    assert elapsed < 5
+    assert sorted(started) == ["boom", "slow"]
+
+
+def test_openai_backend_shares_opt_in_response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """OpenAI バックエンドでも AI_MEETING_CACHE=1 のとき同一リクエストを再送しないこと。"""
+
+    from types import SimpleNamespace
+
+    monkeypatch.setenv("AI_MEETING_CACHE", "1")
+    backend = OpenAIBackend(model="mock")
+    calls: List[Dict[str, Any]] = []
+
+    def _create(**kwargs: Any) -> Any:
+        calls.append(kwargs)
+        message = SimpleNamespace(content=f" 応答{len(calls)} ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    backend.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=_create)))
+    req = LLMRequest(system="sys", messages=[{"role": "user", "content": "ping"}])
+
+    assert backend.generate(req) == "応答1"
+    assert backend.generate(req.model_copy()) == "応答1"
+    assert backend.generate(req.model_copy(update={"temperature": 0.1})) == "応答2"
+    assert len(calls) == 2
+
+    # 最大トークン数が違えば打ち切られた応答を使い回さないこと
+    longer = req.model_copy(update={"max_tokens": req.max_tokens * 2})
+    assert backend.generate(longer) == "応答3"
+    assert calls[-1]["max_tokens"] == req.max_tokens * 2
+    assert backend.generate(longer.model_copy()) == "応答3"
+    assert len(calls) == 3
@@ -97,8 +97,8 @@ def test_run_emits_cycle_payload_in_think_mode(tmp_path, monkeypatch):
     meeting.cfg.resolve_phase = False
     meeting.cfg.phase_goal = {"discussion": "見出し禁止のゴール"}
 
-    def _fake_think(self, agent, last_summary):  # noqa: ANN001 - テスト用
-        return "見出し案を検討し、箇条書きで共有する"
+    def _fake_think_all(self, agents, last_summary):  # noqa: ANN001 - テスト用
+        return {agent.name: "見出し案を検討し、箇条書きで共有する" for agent in agents}
 
     def _fake_judge(self, thoughts, last_summary, flow_summary):  # noqa: ANN001 - テスト用
         return {"winner": "Alice", "scores": {"Alice": {"score": 1.0}}}
@@ -109,7 +109,7 @@ def test_run_emits_cycle_payload_in_think_mode(tmp_path, monkeypatch):
     def _fake_summarize(self, new_turn):  # noqa: ANN001 - テスト用
         return {"summary": "- 決定: 方針を共有"}
 
-    monkeypatch.setattr(Meeting, "_think", _fake_think)
+    monkeypatch.setattr(Meeting, "_think_all", _fake_think_all)
     monkeypatch.setattr(Meeting, "_judge_thoughts", _fake_judge)
     monkeypatch.setattr(Meeting, "_speak_from_thought", _fake_speak)
     monkeypatch.setattr(Meeting, "_summarize_round", _fake_summarize)
@@ -128,3 +128,35 @@ def test_run_emits_cycle_payload_in_think_mode(tmp_path, monkeypatch):
     assert all(isinstance(entry.get("links", []), list) for entry in payload["learn"])
     assert payload["next_goal"].endswith("ゴール")
     assert "見出し" not in payload["next_goal"]
+
+
+def test_think_all_runs_concurrently_and_keeps_agent_order(tmp_path, monkeypatch):
+    """max_concurrency > 1 のバックエンドでは同時に生成し、思考をエージェント順で返すこと。"""
+
+    import threading
+    import time
+
+    meeting = _build_meeting(tmp_path, monkeypatch)
+    names = ["Alice", "Bob", "Carol"]
+    agents = [AgentConfig(name=name, system="あなたは会議参加者です。") for name in names]
+    barrier = threading.Barrier(len(agents), timeout=5)
+    original_request = Meeting._think_request
+
+    def _tagged_request(self, agent, last_summary):  # noqa: ANN001 - テスト用
+        req = original_request(self, agent, last_summary)
+        return req.model_copy(update={"metadata": {"agent": agent.name}})
+
+    def _fake_generate(req):
+        # 全員が揃うまで待ち（直列実行ならタイムアウトする）、後の参加者ほど先に返す
+        barrier.wait()
+        name = req.metadata["agent"]
+        time.sleep(0.01 * (len(names) - names.index(name)))
+        return f" {name}の思考 "
+
+    monkeypatch.setattr(Meeting, "_think_request", _tagged_request)
+    meeting.backend.max_concurrency = len(agents)
+    meeting.backend.generate = _fake_generate  # type: ignore[method-assign]
+
+    thoughts = meeting._think_all(agents, last_summary="")
+
+    assert list(thoughts.items()) == [(name, f"{name}の思考") for name in names]
@@ -0,0 +1,48 @@
+"""`backend.ai_meeting` 配下でクラス・関数が二重定義されていないことを保証するガード。"""
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+import pytest
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "ai_meeting"
+
+
+def _duplicate_top_level_names(path: Path) -> list[str]:
+    """モジュール直下で2回以上定義されたクラス・関数名を返す。"""
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    seen: set[str] = set()
+    duplicates: list[str] = []
+    for node in tree.body:
+        if not isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if node.name in seen:
+            duplicates.append(node.name)
+        seen.add(node.name)
+    return duplicates
+
+
+@pytest.mark.parametrize(
+    "module_path",
+    sorted(PACKAGE_DIR.glob("*.py")),
+    ids=lambda path: path.name,
+)
+def test_module_has_no_duplicate_definitions(module_path: Path) -> None:
+    """同名のクラス・関数を上書き定義しているモジュールがないこと。"""
+
+    assert _duplicate_top_level_names(module_path) == []
+
+
+def test_config_models_defined_once_across_package() -> None:
+    """設定モデルが config.py 以外で再定義されていないこと（スキーマ構築の重複防止）。"""
+
+    owners: dict[str, list[str]] = {"AgentConfig": [], "MeetingConfig": []}
+    for path in sorted(PACKAGE_DIR.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef) and node.name in owners:
+                owners[node.name].append(path.name)
+
+    assert owners == {"AgentConfig": ["config.py"], "MeetingConfig": ["config.py"]}
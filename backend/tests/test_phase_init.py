@@ -2,6 +2,7 @@
 
 from pathlib import Path
 import sys
+import weakref
 
 import pytest
 
@@ -11,7 +12,7 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from backend.ai_meeting.cli import build_meeting_config, parse_args
-from backend.ai_meeting.config import AgentConfig, MeetingConfig
+from backend.ai_meeting.config import DEFAULT_AGENT_IDENTITY, AgentConfig, MeetingConfig
 from backend.ai_meeting.meeting import Meeting
 
 
@@ -79,6 +80,38 @@ def test_phase_turn_limit_auto_scales_with_agents():
     expected = max(len(cfg.agents) * 2, cfg.phase_window, 6)
     assert cfg.get_phase_turn_limit() == expected
 
+
+def test_phase_lookup_follows_reassignment():
+    """フェーズ上限・目標の解決結果が設定の再代入に追従することを検証する。"""
+
+    cfg = MeetingConfig(
+        topic="フェーズ設定の再代入テスト",
+        agents=[AgentConfig(name="Alice", system="あなたは会議参加者です。")],
+        phase_turn_limit={"resolve": 3, "default": 5},
+        phase_goal="議題整理",
+    )
+
+    assert cfg.get_phase_turn_limit("resolve") == 3
+    assert cfg.get_phase_turn_limit("summary") == 5
+    assert cfg.get_phase_goal("resolve") == "議題整理"
+
+    cfg.phase_turn_limit = 4
+    cfg.phase_goal = {"resolve": "残課題の消化"}
+
+    assert cfg.get_phase_turn_limit("resolve") == 4
+    assert cfg.get_phase_goal("resolve") == "残課題の消化"
+    assert cfg.get_phase_goal("discussion") is None
+
+    # 設定値の辞書をその場で書き換えても結果に反映されること
+    cfg.phase_goal["discussion"] = "論点の洗い出し"
+    cfg.phase_turn_limit = {"resolve": 2}
+    assert cfg.get_phase_turn_limit("resolve") == 2
+    cfg.phase_turn_limit["resolve"] = 7
+
+    assert cfg.get_phase_goal("discussion") == "論点の洗い出し"
+    assert cfg.get_phase_turn_limit("resolve") == 7
+
+
 def test_cli_monitor_flags(monkeypatch):
     """CLI の --monitor/--no-monitor フラグが既定値と上書きを適切に扱う。"""
 
@@ -94,3 +127,106 @@ def test_cli_monitor_flags(monkeypatch):
 
     cfg_enabled = build_meeting_config(parse_args(base_args + ["--monitor"]))
     assert cfg_enabled.monitor is True
+
+
+def test_parse_args_does_not_share_default_lists():
+    """解析結果のリストを変更しても、次回の解析の既定値に影響しないこと。"""
+
+    first = parse_args(["--topic", "既定値共有テスト"])
+    first.agents.append("Zed")
+    first.phase_turn_limit.append("3")
+    first.phase_goal.append("議題整理")
+
+    second = parse_args(["--topic", "既定値共有テスト"])
+
+    assert "Zed" not in second.agents
+    assert second.phase_turn_limit == []
+    assert second.phase_goal == []
+
+
+def test_cli_phase_turn_limit_accepts_int_literals():
+    """--phase-turn-limit は int() が受け付ける表記をそのまま解釈すること。"""
+
+    args = parse_args(
+        ["--topic", "上限表記テスト", "--phase-turn-limit", "1_000", "--phase-turn-limit", "resolve= +3"]
+    )
+    cfg = build_meeting_config(args)
+    assert cfg.phase_turn_limit == {"resolve": 3, "default": 1000}
+
+    with pytest.raises(SystemExit, match="数値ではありません"):
+        build_meeting_config(parse_args(["--topic", "上限表記テスト", "--phase-turn-limit", "x"]))
+
+
+def test_agent_lookup_tracks_agents_list():
+    """エージェント名索引が設定順を保ち、agents の差し替えに追従することを検証する。"""
+
+    cfg = MeetingConfig(
+        topic="エージェント索引テスト",
+        agents=[
+            AgentConfig(name="Alice", system="あなたは会議参加者です。"),
+            AgentConfig(name="Bob", system="あなたは会議参加者です。"),
+        ],
+    )
+
+    assert cfg.agent_names == ("Alice", "Bob")
+    assert cfg.find_agent("Bob") is cfg.agents[1]
+    assert cfg.find_agent("Carol") is None
+
+    cfg.agents = [AgentConfig(name="Carol", system="あなたは会議参加者です。")]
+
+    assert cfg.agent_names == ("Carol",)
+    assert cfg.find_agent("Alice") is None
+    assert cfg.find_agent("Carol") is cfg.agents[0]
+
+    # リストのその場での差し替え・改名にも追従すること
+    cfg.agents[0] = AgentConfig(name="Dave", system="あなたは会議参加者です。")
+    cfg.agents[0].name = "Erin"
+    assert cfg.agent_names == ("Erin",)
+    assert cfg.find_agent("Dave") is None
+    assert cfg.find_agent("Erin") is cfg.agents[0]
+
+
+def test_agent_identity_default_is_independent_copy():
+    """既定 Identity は DEFAULT_AGENT_IDENTITY と同値で、入れ子の dict/list を共有しないこと。"""
+
+    first = AgentConfig(name="Alice", system="あなたは会議参加者です。").identity
+    second = AgentConfig(name="Bob", system="あなたは会議参加者です。").identity
+
+    assert first == DEFAULT_AGENT_IDENTITY
+
+    def _containers(value):
+        if isinstance(value, dict):
+            yield value
+            for item in value.values():
+                yield from _containers(item)
+        elif isinstance(value, list):
+            yield value
+            for item in value:
+                yield from _containers(item)
+
+    default_ids = {id(obj) for obj in _containers(DEFAULT_AGENT_IDENTITY)}
+    assert default_ids.isdisjoint(id(obj) for obj in _containers(first))
+    assert {id(obj) for obj in _containers(first)}.isdisjoint(id(obj) for obj in _containers(second))
+
+
+def test_config_models_support_weak_references():
+    """設定モデルを弱参照できること（キャッシュ等で弱参照が使われるため）。"""
+
+    agent = AgentConfig(name="Alice", system="あなたは会議参加者です。")
+    cfg = MeetingConfig(topic="弱参照テスト", agents=[agent])
+
+    assert weakref.ref(agent)() is agent
+    assert weakref.ref(cfg)() is cfg
+
+
+def test_resolve_round_legacy_name_is_accepted():
+    """旧設定名 resolve_round が resolve_phase として読み替えられることを検証する。"""
+
+    agents = [AgentConfig(name="Alice", system="あなたは会議参加者です。")]
+
+    legacy = MeetingConfig(topic="旧設定名テスト", agents=agents, resolve_round=False)
+    current = MeetingConfig(topic="旧設定名テスト", agents=agents, resolve_phase=False)
+
+    assert legacy.resolve_phase is False
+    assert current.resolve_phase is False
+    assert "resolve_round" not in legacy.model_dump()
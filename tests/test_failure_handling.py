@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import signal
+import sys
 from pathlib import Path
 
 import pytest
@@ -106,3 +109,114 @@ def test_conversation_summary_handles_invalid_inputs(monkeypatch: pytest.MonkeyP
         assert "conversation_summary_invalid_turn_content" in messages
     finally:
         shutil.rmtree(meeting.logger.dir, ignore_errors=True)
+
+
+_SIGTERM_CHILD = """
+import sys, threading, time
+from pathlib import Path
+from backend.ai_meeting import cli
+from backend.ai_meeting.llm import LLMBackend, LLMRequest
+from backend.ai_meeting.logging import LiveLogWriter
+
+outdir = Path(sys.argv[1])
+started = threading.Barrier(4)
+
+class SlowBackend(LLMBackend):
+    max_concurrency = 3
+
+    def generate(self, req):
+        started.wait()
+        time.sleep(30)
+        return ""
+
+class BlockedMeeting:
+    def __init__(self, cfg):
+        self.logger = LiveLogWriter(cfg.topic, outdir=cfg.outdir)
+
+    def run(self):
+        self.logger.append_thoughts({"agent": "Alice", "thought": "停止直前の思考"})
+        reqs = [LLMRequest(system="sys", messages=[{"role": "user", "content": str(i)}]) for i in range(3)]
+        threading.Thread(target=lambda: (started.wait(), (outdir / "started").touch()), daemon=True).start()
+        SlowBackend().generate_many(reqs)
+
+cli.Meeting = BlockedMeeting
+sys.argv = ["ai_meeting", "--topic", "停止テスト", "--outdir", str(outdir)]
+cli.main()
+"""
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX の SIGTERM を前提とする")
+def test_cli_sigterm_during_concurrent_generation_exits_promptly(tmp_path: Path) -> None:
+    """並列生成の通信待ち中に SIGTERM を受けても、通信完了を待たずにログを書き出して終了すること。"""
+
+    import subprocess
+    import time
+
+    outdir = tmp_path / "logs"
+    repo_root = Path(__file__).resolve().parents[1]
+    env = dict(os.environ, PYTHONPATH=str(repo_root))
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _SIGTERM_CHILD, str(outdir)],
+        cwd=repo_root,
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while not (outdir / "started").exists():
+            assert proc.poll() is None, proc.stderr.read()
+            assert time.monotonic() < deadline, "並列生成が開始されること"
+            time.sleep(0.05)
+
+        began = time.monotonic()
+        proc.send_signal(signal.SIGTERM)
+        returncode = proc.wait(timeout=10)
+        elapsed = time.monotonic() - began
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    assert returncode == 128 + signal.SIGTERM
+    assert elapsed < 5, "実行中の LLM 通信（30 秒）の完了を待たないこと"
+    thoughts = (outdir / "thoughts.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["thought"] for line in thoughts] == ["停止直前の思考"]
+
+
+def test_cli_main_runs_off_main_thread(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """メインスレッド以外から起動してもシグナル設定で失敗せず、ログを閉じて終わること。"""
+
+    import threading
+
+    from backend.ai_meeting import cli
+    from backend.ai_meeting.logging import LiveLogWriter
+
+    class _QuickMeeting:
+        def __init__(self, cfg: MeetingConfig) -> None:
+            self.logger = LiveLogWriter(cfg.topic, outdir=cfg.outdir)
+
+        def run(self) -> None:
+            self.logger.append_thoughts({"agent": "Alice", "thought": "別スレッド"})
+
+    monkeypatch.setattr(cli, "Meeting", _QuickMeeting)
+    monkeypatch.setattr(
+        sys, "argv", ["ai_meeting", "--topic", "スレッドテスト", "--outdir", str(tmp_path / "logs")]
+    )
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    errors: list[BaseException] = []
+
+    def _target() -> None:
+        try:
+            cli.main()
+        except BaseException as exc:  # noqa: BLE001 - スレッド内の例外を検証側へ渡す
+            errors.append(exc)
+
+    worker = threading.Thread(target=_target)
+    worker.start()
+    worker.join(timeout=10)
+
+    assert errors == []
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+    thoughts = (tmp_path / "logs" / "thoughts.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["thought"] for line in thoughts] == ["別スレッド"]
@@ -54,3 +54,40 @@ def test_meeting_result_retains_required_metadata(tmp_path, monkeypatch) -> None
         assert not (log_dir / "meeting_live.md").exists(), "無効化した Markdown ログファイルが生成されていないこと"
     finally:
         shutil.rmtree(meeting.logger.dir, ignore_errors=True)
+
+
+def test_logs_are_checkpointed_before_result_is_written(tmp_path, monkeypatch) -> None:
+    """ラウンドごとと meeting_result.json の書き出し前に、補助ログがディスクへ確定されること。"""
+
+    from backend.ai_meeting.logging import LiveLogWriter
+
+    monkeypatch.setenv("AI_MEETING_TEST_MODE", "1")
+    cfg = _create_config(tmp_path / "logs")
+    cfg.phase_turn_limit = 3
+    meeting = Meeting(cfg)
+    snapshots = []
+    original_checkpoint = LiveLogWriter.checkpoint
+
+    def _spy_checkpoint(self) -> None:
+        original_checkpoint(self)
+        snapshots.append(
+            (
+                (self.dir / "meeting_result.json").exists(),
+                self.phase_log.read_text(encoding="utf-8").count("\n")
+                if self.phase_log.exists()
+                else 0,
+            )
+        )
+
+    monkeypatch.setattr(LiveLogWriter, "checkpoint", _spy_checkpoint)
+
+    try:
+        meeting.run()
+        phase_lines = meeting.logger.phase_log.read_text(encoding="utf-8").count("\n")
+
+        assert len(snapshots) >= len(meeting.history) + 3
+        assert not snapshots[-1][0], "最後の確定は meeting_result.json の書き出し前に行われること"
+        assert phase_lines > 0
+        assert snapshots[-1][1] == phase_lines
+    finally:
+        shutil.rmtree(meeting.logger.dir, ignore_errors=True)